@@ -15,10 +15,16 @@ from .get_helpers import list_helpers
 from .get_labels import list_labels
 from .get_users import list_users
 from .get_auths import list_auths
-from .set_auths import async_sync_group_dashboards_to_users, create_group, delete_group, migrate_legacy_auth_data, rename_group, set_auths
-from .get_dashboards import list_dashboards
+from .set_auths import async_sync_group_dashboards_to_users, create_group, delete_group, get_sync_scheduler, migrate_legacy_auth_data, rename_group, set_auths, set_auths_batch
+from .get_dashboards import dashboard_cache_stats, list_dashboards
+from .group_dashboards import async_get_group_dashboard_permissions
+from .integration_names import get_integration_names
+from .registry_subscription import subscribe_registries
+from .bootstrap import bootstrap
+from .revisions import get_revision_tracker
 
 from .const import (
+    DEFAULT_SYNC_DELAY,
     DOMAIN,
     DEST_PATH_SCRIPT_JS,
     SOURCE_PATH_SCRIPT_JS,
@@ -48,17 +54,23 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the ha_access_control_manager component."""
 
     _register_public_api(hass)
+    get_revision_tracker(hass)
 
     websocket_api.async_register_command(hass, list_users)
     websocket_api.async_register_command(hass, list_devices)
     websocket_api.async_register_command(hass, list_helpers)
+    websocket_api.async_register_command(hass, subscribe_registries)
+    websocket_api.async_register_command(hass, bootstrap)
     websocket_api.async_register_command(hass, list_labels)
     websocket_api.async_register_command(hass, list_auths)
     websocket_api.async_register_command(hass, create_group)
     websocket_api.async_register_command(hass, rename_group)
     websocket_api.async_register_command(hass, delete_group)
     websocket_api.async_register_command(hass, set_auths)
+    websocket_api.async_register_command(hass, set_auths_batch)
     websocket_api.async_register_command(hass, list_dashboards)
+    websocket_api.async_register_command(hass, dashboard_cache_stats)
+    await async_get_group_dashboard_permissions(hass)
     await migrate_legacy_auth_data(hass)
     
     source_path = hass.config.path(SOURCE_PATH_SCRIPT_JS)
@@ -88,6 +100,11 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     if path.startswith("/"):
         path = path[1:]
 
+    _apply_sync_delay(hass, config_entry)
+    config_entry.async_on_unload(config_entry.add_update_listener(_async_options_updated))
+    hass.async_create_background_task(
+        get_integration_names(hass).async_prewarm(), "ha_access_control integration names prewarm"
+    )
 
     panels = hass.data.get("frontend_panels", {})
     if path in panels:
@@ -108,6 +125,14 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     return True
 
 
+def _apply_sync_delay(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    get_sync_scheduler(hass).delay = float(config_entry.options.get("sync_delay", DEFAULT_SYNC_DELAY))
+
+
+async def _async_options_updated(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    _apply_sync_delay(hass, config_entry)
+
+
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry):
     """Unload a config entry."""
     path = config_entry.options.get("path", config_entry.data.get("path_to_admin_ui", "/ha-access-control-manager"))
@@ -118,6 +143,8 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry):
     panels = hass.data.get("frontend_panels", {})
     if path in panels:
         frontend.async_remove_panel(hass, path)
+
+    await get_sync_scheduler(hass).async_flush()
     return True
 
 async def async_copy_file(source_path, dest_path):
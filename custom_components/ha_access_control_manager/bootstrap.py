@@ -0,0 +1,73 @@
+from collections.abc import Callable
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+
+from .get_dashboards import async_get_dashboards
+from .get_users import build_user_rows
+from .registry_subscription import SUBSCRIBE_SCHEMA, async_start_subscription
+from .revisions import REVISION_USERS, get_revision_tracker
+from .set_auths import _attach_group_dashboards, get_auth_revision, serialize_runtime_auth_data
+
+SECTION_USERS = "users"
+SECTION_AUTHS = "auths"
+SECTION_DASHBOARDS = "dashboards"
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "ha_access_control/bootstrap",
+        **SUBSCRIBE_SCHEMA,
+    }
+)
+@websocket_api.require_admin
+@callback
+def bootstrap(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Everything the panel loads, as sections of one subscription.
+
+    Users, groups and dashboards come first, then the registry sections of
+    ``subscribe_registries`` and its diffs. Each section carries the revision
+    of the matching ``list_*`` command and is answered with ``not_modified``
+    when ``revisions`` already holds it.
+    """
+    revisions = msg["revisions"]
+
+    async def _async_send_account_sections(send: Callable[[dict[str, Any]], None]) -> None:
+        # list_users and list_auths share one revision and one read of the users.
+        account_revision = get_revision_tracker(hass).token(REVISION_USERS, extra=get_auth_revision(hass))
+        users_current = revisions.get(SECTION_USERS) == account_revision
+        auths_current = revisions.get(SECTION_AUTHS) == account_revision
+        users = None if users_current and auths_current else await hass.auth.async_get_users()
+
+        if users_current:
+            _send_not_modified(send, SECTION_USERS, account_revision)
+        else:
+            _send_data(send, SECTION_USERS, account_revision, build_user_rows(users))
+
+        if auths_current:
+            _send_not_modified(send, SECTION_AUTHS, account_revision)
+        else:
+            auth_data = await serialize_runtime_auth_data(hass, users)
+            await _attach_group_dashboards(hass, auth_data)
+            _send_data(send, SECTION_AUTHS, account_revision, auth_data)
+
+        dashboards_revision, dashboards = await async_get_dashboards(hass, revisions.get(SECTION_DASHBOARDS))
+        if dashboards is None:
+            _send_not_modified(send, SECTION_DASHBOARDS, dashboards_revision)
+        else:
+            _send_data(send, SECTION_DASHBOARDS, dashboards_revision, dashboards)
+
+    async_start_subscription(hass, connection, msg, _async_send_account_sections)
+
+
+def _send_not_modified(send: Callable[[dict[str, Any]], None], section: str, revision: str) -> None:
+    send({"section": section, "revision": revision, "not_modified": True})
+
+
+def _send_data(send: Callable[[dict[str, Any]], None], section: str, revision: str, data: Any) -> None:
+    send({"section": section, "revision": revision, "data": data})
@@ -0,0 +1,108 @@
+from collections.abc import Iterable
+from typing import Any
+
+import voluptuous as vol
+
+FORMAT_ROWS = "rows"
+FORMAT_COLUMNAR = "columnar"
+
+FORMAT_SCHEMA = {
+    vol.Optional("format", default=FORMAT_ROWS): vol.In([FORMAT_ROWS, FORMAT_COLUMNAR]),
+}
+
+# Column encodings: an index into the payload ``strings``, or a list of indexes
+# into the payload ``objects`` (label, integration and assistant dicts).
+ENCODE_STRING = "string"
+ENCODE_OBJECTS = "objects"
+
+
+def wants_columnar(msg: dict[str, Any]) -> bool:
+    return msg.get("format") == FORMAT_COLUMNAR
+
+
+def format_extra(msg: dict[str, Any], extra: str | None) -> str | None:
+    """Extra revision component: the same rows encoded differently are another payload."""
+    if not wants_columnar(msg):
+        return extra
+
+    return f"{extra or ''}|{FORMAT_COLUMNAR}"
+
+
+class ColumnarEncoder:
+    """Encode row tables as column arrays sharing one string and one object dictionary.
+
+    A table is ``{"count", "columns", "encodings"[, "missing"]}``: ``columns``
+    maps each key to one value per row, ``encodings`` names the dictionary
+    encoded columns and ``missing`` lists, per column, the rows without that key.
+    """
+
+    def __init__(self) -> None:
+        self._strings: dict[str, int] = {}
+        self._objects: dict[tuple[tuple[str, Any], ...], int] = {}
+        self._object_values: list[dict[str, Any]] = []
+
+    def encode_table(self, rows: list[dict[str, Any]], encodings: dict[str, str]) -> dict[str, Any]:
+        names = list(dict.fromkeys(key for row in rows for key in row))
+        columns: dict[str, list[Any]] = {}
+        missing: dict[str, list[int]] = {}
+
+        for name in names:
+            encoding = encodings.get(name)
+            values: list[Any] = []
+            for position, row in enumerate(rows):
+                if name not in row:
+                    missing.setdefault(name, []).append(position)
+                    values.append(None)
+                elif encoding == ENCODE_STRING:
+                    values.append(self._string(row[name]))
+                elif encoding == ENCODE_OBJECTS:
+                    values.append(self._object_list(row[name]))
+                else:
+                    values.append(row[name])
+            columns[name] = values
+
+        table: dict[str, Any] = {
+            "count": len(rows),
+            "columns": columns,
+            "encodings": {name: encodings[name] for name in names if name in encodings},
+        }
+        if missing:
+            table["missing"] = missing
+        return table
+
+    def payload(self, **tables: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "format": FORMAT_COLUMNAR,
+            "strings": list(self._strings),
+            "objects": self._object_values,
+            **tables,
+        }
+
+    def _string(self, value: Any) -> int | None:
+        if value is None:
+            return None
+
+        index = self._strings.get(value)
+        if index is None:
+            index = self._strings[value] = len(self._strings)
+        return index
+
+    def _object_list(self, values: Iterable[dict[str, Any]] | None) -> list[int] | None:
+        if values is None:
+            return None
+
+        indexes = []
+        for value in values:
+            key = tuple(value.items())
+            index = self._objects.get(key)
+            if index is None:
+                index = self._objects[key] = len(self._object_values)
+                self._object_values.append(value)
+            indexes.append(index)
+        return indexes
+
+
+def encode_rows(rows: list[dict[str, Any]], encodings: dict[str, str]) -> dict[str, Any]:
+    """Columnar payload of a flat listing, with its rows under ``rows``."""
+    encoder = ColumnarEncoder()
+    return encoder.payload(rows=encoder.encode_table(rows, encodings))
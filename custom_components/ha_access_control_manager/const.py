@@ -11,8 +11,38 @@ LOVELACE_DASHBOARDS_PATH = ".storage/lovelace_dashboards"
 LOVELACE_STORAGE = ".storage/lovelace"
 LOVELACE_STORAGE_PREFIX = ".storage/lovelace."
 LOVELACE_STORAGE_DIR = ".storage"
-GROUP_DASHBOARD_PERMISSIONS_PATH = ".storage/ha_access_control_manager_dashboards"
+LOVELACE_DATA = "lovelace"
+LOVELACE_MODE_STORAGE = "storage"
+GROUP_DASHBOARDS_STORAGE_KEY = "ha_access_control_manager_dashboards"
+GROUP_DASHBOARDS_STORAGE_VERSION = 1
+GROUP_DASHBOARDS_SAVE_DELAY = 5
+DATA_GROUP_DASHBOARDS = "group_dashboards"
 SYSTEM_GROUP_IDS = {"system-admin", "system-users", "system-read-only"}
+SYSTEM_GROUPS_WITH_FULL_DASHBOARD_ACCESS = {"system-admin", "system-users"}
+DEFAULT_SYNC_DELAY = 2.0
+AUTH_SAVE_DELAY = 1
+DASHBOARD_IO_CONCURRENCY = 4
+DASHBOARD_CACHE_MAX_BYTES = 32 * 1024 * 1024
+DATA_DASHBOARD_CACHE = "dashboard_cache"
+DATA_DASHBOARD_REPOSITORY = "dashboard_repository"
+DATA_VIEW_INDEX = "view_index"
+VIEW_INDEX_STORAGE_KEY = f"{DOMAIN}.view_index"
+VIEW_INDEX_STORAGE_VERSION = 1
+VIEW_INDEX_SAVE_DELAY = 10
+DATA_SYNC_SCHEDULER = "sync_scheduler"
+DATA_AUTH_REVISION = "auth_revision"
+DATA_REVISIONS = "revisions"
+DATA_DEVICE_SNAPSHOT = "device_snapshot"
+DATA_INTEGRATION_NAMES = "integration_names"
+STREAM_CHUNK_SIZE = 200
+MAX_CACHED_PROJECTIONS = 4
+DATA_TABLE_INDEXES = "table_indexes"
+DATA_LOOKUPS = "lookups"
+DATA_HELPER_INDEX = "helper_index"
+DEFAULT_PAGE_SIZE = 50
+DATA_REGISTRY_PUBLISHER = "registry_publisher"
+REGISTRY_DIFF_DELAY = 0.5
+MAX_PAGE_SIZE = 1000
 
 ICONS = [
     "mdi:lock","mdi:lock-open","mdi:key",
@@ -0,0 +1,122 @@
+from collections import OrderedDict
+import logging
+import os
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .file_manager import get_json_file, save_json_file
+from .const import DASHBOARD_CACHE_MAX_BYTES, DATA_DASHBOARD_CACHE, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class DashboardStorageCache:
+    """Parsed Lovelace storage files keyed by path and validated by (mtime, size).
+
+    Entries are evicted least-recently-used once the summed file sizes exceed
+    ``max_bytes``. Returned objects are shared: callers that mutate one must
+    write it back with ``async_save`` (or ``invalidate`` it) so the cache never
+    serves a copy that differs from disk.
+    """
+
+    def __init__(self, max_bytes: int = DASHBOARD_CACHE_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._total_bytes = 0
+        self._entries: OrderedDict[str, tuple[tuple[int, int], Any]] = OrderedDict()
+
+    async def async_get(self, hass: HomeAssistant, file_path: str) -> Any | None:
+        fingerprint = await async_file_fingerprint(hass, file_path)
+        if fingerprint is None:
+            self.invalidate(file_path)
+            return None
+
+        entry = self._entries.get(file_path)
+        if entry is not None and entry[0] == fingerprint:
+            self.hits += 1
+            self._entries.move_to_end(file_path)
+            return entry[1]
+
+        self.misses += 1
+        data = await get_json_file(hass, file_path)
+        if data is None:
+            self.invalidate(file_path)
+            return None
+
+        self._store(file_path, fingerprint, data)
+        return data
+
+    async def async_save(self, hass: HomeAssistant, file_path: str, data: Any) -> tuple[int, int] | None:
+        """Write ``data`` and keep it cached; return the new file fingerprint."""
+        try:
+            await save_json_file(hass, file_path, data)
+        except Exception:
+            self.invalidate(file_path)
+            raise
+
+        fingerprint = await async_file_fingerprint(hass, file_path)
+        if fingerprint is None:
+            self.invalidate(file_path)
+            return None
+
+        self._store(file_path, fingerprint, data)
+        return fingerprint
+
+    def invalidate(self, file_path: str) -> None:
+        entry = self._entries.pop(file_path, None)
+        if entry is not None:
+            self._total_bytes -= entry[0][1]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._total_bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else None,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def _store(self, file_path: str, fingerprint: tuple[int, int], data: Any) -> None:
+        self.invalidate(file_path)
+
+        size = fingerprint[1]
+        if size > self.max_bytes:
+            return
+
+        self._entries[file_path] = (fingerprint, data)
+        self._total_bytes += size
+
+        while self._total_bytes > self.max_bytes and self._entries:
+            evicted_path, (evicted_fingerprint, _) = self._entries.popitem(last=False)
+            self._total_bytes -= evicted_fingerprint[1]
+            self.evictions += 1
+            _LOGGER.debug("Evicted %s from the dashboard storage cache", evicted_path)
+
+
+async def async_file_fingerprint(hass: HomeAssistant, file_path: str) -> tuple[int, int] | None:
+    """Return ``(mtime_ns, size)`` of a file, or None when it does not exist."""
+    try:
+        stat_result = await hass.async_add_executor_job(os.stat, file_path)
+    except FileNotFoundError:
+        return None
+
+    return stat_result.st_mtime_ns, stat_result.st_size
+
+
+def get_dashboard_cache(hass: HomeAssistant) -> DashboardStorageCache:
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    cache = domain_data.get(DATA_DASHBOARD_CACHE)
+    if cache is None:
+        cache = domain_data[DATA_DASHBOARD_CACHE] = DashboardStorageCache()
+
+    return cache
@@ -0,0 +1,252 @@
+import os
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .dashboard_cache import async_file_fingerprint, get_dashboard_cache
+from .lovelace_backend import (
+    LoadedDashboard,
+    async_load_dashboard,
+    async_load_runtime_config,
+    get_runtime_dashboards,
+    storage_candidates,
+)
+from .view_index import get_view_index, summarize_dashboard
+from .const import (
+    DATA_DASHBOARD_REPOSITORY,
+    DOMAIN,
+    LOVELACE_DASHBOARDS_PATH,
+    LOVELACE_STORAGE,
+    LOVELACE_STORAGE_DIR,
+    LOVELACE_STORAGE_PREFIX,
+)
+
+STORAGE_FILE_PREFIX = "lovelace."
+
+
+class DashboardRepository:
+    """Dashboard discovery and loading shared by the dashboard listing and the view sync.
+
+    ``lovelace_dashboards`` is read through the dashboard storage cache, and
+    ``.storage`` is listed again only when the directory changed. Loads reuse
+    the listing validated by the last ``async_entries``/``async_targets`` call
+    and skip storage candidates it shows are absent, so resolving ``lovelace``
+    against ``lovelace.lovelace`` costs no extra file access.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._storage_listing: tuple[int, tuple[str, ...], frozenset[str]] | None = None
+
+    async def async_definitions(self) -> dict[str, dict[str, Any]]:
+        """Dashboards declared in ``lovelace_dashboards``, keyed by id."""
+        store = await get_dashboard_cache(self._hass).async_get(
+            self._hass, self._hass.config.path(LOVELACE_DASHBOARDS_PATH)
+        )
+        data = store.get("data") if isinstance(store, dict) else None
+        return _extract_definitions(data)
+
+    async def async_entries(self) -> list[tuple[str, dict[str, Any]]]:
+        """Every known dashboard as ``(dashboard_id, info)``: declared ones, the default
+        dashboard, then storage files that are not declared."""
+        entries = list((await self.async_definitions()).items())
+        seen_ids = {dashboard_id for dashboard_id, _ in entries}
+
+        if "lovelace" not in seen_ids:
+            entries.append(
+                (
+                    "lovelace",
+                    {
+                        "title": "Lovelace",
+                        "url_path": "lovelace",
+                        "filename": LOVELACE_STORAGE,
+                    },
+                )
+            )
+            seen_ids.add("lovelace")
+
+        storage_files, _ = await self._async_storage_files()
+        for filename in storage_files:
+            if not filename.startswith(STORAGE_FILE_PREFIX):
+                continue
+            dashboard_id = filename[len(STORAGE_FILE_PREFIX) :]
+            if not dashboard_id or dashboard_id in seen_ids:
+                continue
+            entries.append(
+                (
+                    dashboard_id,
+                    {
+                        "filename": f"{LOVELACE_STORAGE_DIR}/{filename}",
+                        "url_path": dashboard_id,
+                    },
+                )
+            )
+            seen_ids.add(dashboard_id)
+
+        return entries
+
+    async def async_targets(self, dashboard_ids: set[str] | None = None) -> list[tuple[str, str]]:
+        """``(dashboard_id, filename)`` of the given dashboards, or of every dashboard when None."""
+        if dashboard_ids is None:
+            return [
+                (dashboard_id, dashboard_filename(dashboard_id, dashboard_info))
+                for dashboard_id, dashboard_info in await self.async_entries()
+            ]
+
+        await self._async_storage_files()
+        definitions = await self.async_definitions()
+        return [
+            (dashboard_id, dashboard_filename(dashboard_id, definitions.get(dashboard_id)))
+            for dashboard_id in sorted(dashboard_ids)
+        ]
+
+    async def async_load(
+        self,
+        dashboard_id: str,
+        filename: str,
+        runtime_dashboards: dict[str, Any] | None = None,
+    ) -> LoadedDashboard | None:
+        if self._storage_listing is None:
+            await self._async_storage_files()
+
+        return await async_load_dashboard(
+            self._hass, dashboard_id, filename, runtime_dashboards, may_exist=self._may_exist
+        )
+
+    async def async_view_summary(
+        self,
+        dashboard_id: str,
+        filename: str,
+        runtime_dashboards: dict[str, Any] | None = None,
+    ) -> dict[str, Any] | None:
+        """Title and views of a dashboard, without keeping its cards in memory.
+
+        Storage files, which storage-mode runtime dashboards save to as well,
+        go through the persistent view index and are only parsed when they
+        changed since they were last summarized. The Lovelace runtime is only
+        asked when no storage file holds the dashboard, since loading it keeps
+        the whole card tree in Home Assistant's memory.
+        """
+        if self._storage_listing is None:
+            await self._async_storage_files()
+
+        view_index = get_view_index(self._hass)
+        for candidate in storage_candidates(dashboard_id, filename):
+            if not self._may_exist(candidate):
+                continue
+
+            summary = await view_index.async_get(self._hass.config.path(candidate))
+            if summary is not None:
+                return summary
+
+        if runtime_dashboards is None:
+            runtime_dashboards = get_runtime_dashboards(self._hass)
+
+        runtime = runtime_dashboards.get(dashboard_id)
+        if runtime is not None:
+            config = await async_load_runtime_config(runtime)
+            if config is not None:
+                return summarize_dashboard(config)
+
+        return None
+
+    async def async_storage_fingerprints(
+        self, dashboard_id: str, filename: str
+    ) -> list[tuple[str, tuple[int, int]]]:
+        """``(candidate, (mtime_ns, size))`` of the storage files that may hold a dashboard."""
+        if self._storage_listing is None:
+            await self._async_storage_files()
+
+        fingerprints = []
+        for candidate in storage_candidates(dashboard_id, filename):
+            if not self._may_exist(candidate):
+                continue
+
+            fingerprint = await async_file_fingerprint(self._hass, self._hass.config.path(candidate))
+            if fingerprint is not None:
+                fingerprints.append((candidate, fingerprint))
+
+        return fingerprints
+
+    def retain_view_summaries(self, targets: list[tuple[str, str]]) -> None:
+        """Drop view index entries of storage files that no dashboard refers to anymore."""
+        get_view_index(self._hass).async_retain(
+            self._hass.config.path(candidate)
+            for dashboard_id, filename in targets
+            for candidate in storage_candidates(dashboard_id, filename)
+        )
+
+    def _may_exist(self, candidate: str) -> bool:
+        storage_names = self._storage_listing[2] if self._storage_listing is not None else frozenset()
+        directory, name = os.path.split(candidate)
+        return directory != LOVELACE_STORAGE_DIR or name in storage_names
+
+    async def _async_storage_files(self) -> tuple[tuple[str, ...], frozenset[str]]:
+        self._storage_listing = await self._hass.async_add_executor_job(
+            _list_storage_dir, self._hass.config.path(LOVELACE_STORAGE_DIR), self._storage_listing
+        )
+        if self._storage_listing is None:
+            return (), frozenset()
+
+        return self._storage_listing[1], self._storage_listing[2]
+
+
+def _list_storage_dir(
+    storage_dir: str, cached: tuple[int, tuple[str, ...], frozenset[str]] | None
+) -> tuple[int, tuple[str, ...], frozenset[str]] | None:
+    try:
+        mtime = os.stat(storage_dir).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    if cached is not None and cached[0] == mtime:
+        return cached
+
+    names = tuple(os.listdir(storage_dir))
+    return mtime, names, frozenset(names)
+
+
+def _extract_definitions(dashboards_data: Any) -> dict[str, dict[str, Any]]:
+    if not isinstance(dashboards_data, dict):
+        return {}
+
+    definitions: dict[str, dict[str, Any]] = {}
+
+    items = dashboards_data.get("items")
+    if isinstance(items, list):
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+
+            dashboard_id = item.get("id")
+            if not isinstance(dashboard_id, str) or not dashboard_id or dashboard_id in definitions:
+                continue
+
+            definitions[dashboard_id] = item
+
+    dashboards = dashboards_data.get("dashboards")
+    if isinstance(dashboards, dict):
+        for dashboard_id, dashboard_info in dashboards.items():
+            if not isinstance(dashboard_id, str) or not dashboard_id or dashboard_id in definitions:
+                continue
+
+            definitions[dashboard_id] = dashboard_info if isinstance(dashboard_info, dict) else {}
+
+    return definitions
+
+
+def dashboard_filename(dashboard_id: str, dashboard_info: Any) -> str:
+    filename = dashboard_info.get("filename") if isinstance(dashboard_info, dict) else None
+    if isinstance(filename, str) and filename:
+        return filename
+
+    return LOVELACE_STORAGE if dashboard_id == "lovelace" else f"{LOVELACE_STORAGE_PREFIX}{dashboard_id}"
+
+
+def get_dashboard_repository(hass: HomeAssistant) -> DashboardRepository:
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    repository = domain_data.get(DATA_DASHBOARD_REPOSITORY)
+    if repository is None:
+        repository = domain_data[DATA_DASHBOARD_REPOSITORY] = DashboardRepository(hass)
+
+    return repository
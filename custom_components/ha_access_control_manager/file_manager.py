@@ -1,25 +1,72 @@
-import aiofiles
-import json
+import asyncio
+from collections.abc import Awaitable, Iterable
+import logging
+from typing import Any, TypeVar
 
-async def get_json_file(file_path):
+import orjson
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_encoder_default
+from homeassistant.util.file import write_utf8_file
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+async def gather_with_concurrency(limit: int, awaitables: Iterable[Awaitable[_T]]) -> list[_T]:
+    """Await all awaitables with at most ``limit`` running at once, keeping input order."""
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def _run(awaitable: Awaitable[_T]) -> _T:
+        async with semaphore:
+            return await awaitable
+
+    return await asyncio.gather(*(_run(awaitable) for awaitable in awaitables))
+
+
+async def get_json_file(hass: HomeAssistant, file_path: str) -> Any | None:
+    """Read and decode a JSON file in the executor; None when it is missing or invalid."""
+    return await hass.async_add_executor_job(_read_json_file, file_path)
+
+
+async def save_json_file(hass: HomeAssistant, file_path: str, data: Any) -> bool:
+    """Encode and write ``data`` atomically in the executor.
+
+    Returns False when the file already held exactly these bytes and was left untouched.
+    """
+    return await hass.async_add_executor_job(_write_json_file, file_path, data)
+
+
+def _read_json_file(file_path: str) -> Any | None:
     try:
-        async with aiofiles.open(file_path, mode="r") as file:
-            content = await file.read()
-            data = json.loads(content)
-        return data
+        with open(file_path, "rb") as file:
+            content = file.read()
     except FileNotFoundError:
-        print(f"Erreur : {file_path} not found.")
+        _LOGGER.debug("%s not found", file_path)
         return None
-    except json.JSONDecodeError:
-        print(f"Error : {file_path} is an invalid JSON.")
+
+    try:
+        return json_loads(content)
+    except JSON_DECODE_EXCEPTIONS:
+        _LOGGER.warning("%s is not valid JSON", file_path)
         return None
-    
-async def save_json_file(file_path, data):
+
+
+def _write_json_file(file_path: str, data: Any) -> bool:
+    content = orjson.dumps(
+        data,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        default=json_encoder_default,
+    )
+
     try:
-        async with aiofiles.open(file_path, mode="w") as file:
-            # Convertir les données en JSON
-            content = json.dumps(data, indent=4)
-            # Écrire le contenu dans le fichier
-            await file.write(content)
-    except json.JSONDecodeError:
-        print(f"Erreur : {file_path} is an invalid JSON.")
\ No newline at end of file
+        with open(file_path, "rb") as file:
+            if file.read() == content:
+                return False
+    except FileNotFoundError:
+        pass
+
+    write_utf8_file(file_path, content, mode="wb")
+    return True
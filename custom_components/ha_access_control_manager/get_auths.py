@@ -5,15 +5,25 @@ import voluptuous as vol
 from homeassistant.components import websocket_api
 from homeassistant.core import HomeAssistant
 
-from .set_auths import _attach_group_dashboards, serialize_runtime_auth_data
+from .revisions import REVISION_USERS, get_revision_tracker, send_not_modified, send_revisioned_result
+from .set_auths import _attach_group_dashboards, get_auth_revision, serialize_runtime_auth_data
 
 
-@websocket_api.websocket_command({vol.Required("type"): "ha_access_control/list_auths"})
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "ha_access_control/list_auths",
+        vol.Optional("revision"): vol.Any(str, None),
+    }
+)
 @websocket_api.require_admin
 @websocket_api.async_response
 async def list_auths(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
+    revision = get_revision_tracker(hass).token(REVISION_USERS, extra=get_auth_revision(hass))
+    if send_not_modified(connection, msg, revision):
+        return
+
     auth_data = await serialize_runtime_auth_data(hass)
     await _attach_group_dashboards(hass, auth_data)
-    connection.send_result(msg["id"], auth_data)
+    send_revisioned_result(connection, msg, revision, auth_data)
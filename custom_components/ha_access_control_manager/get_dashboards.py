@@ -1,25 +1,26 @@
 from __future__ import annotations
 
 from typing import Any
-import os
 import voluptuous as vol
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.components import websocket_api
 
-from .file_manager import get_json_file
-from .const import (
-    LOVELACE_DASHBOARDS_PATH,
-    LOVELACE_STORAGE,
-    LOVELACE_STORAGE_DIR,
-    LOVELACE_STORAGE_PREFIX,
-)
+from .dashboard_cache import get_dashboard_cache
+from .dashboard_repository import DashboardRepository, dashboard_filename, get_dashboard_repository
+from .get_users import build_user_rows
+from .file_manager import gather_with_concurrency
+from .lovelace_backend import get_runtime_dashboards
+from .revisions import content_revision, send_not_modified, send_revisioned_result
+from .const import DASHBOARD_IO_CONCURRENCY
 
 
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "ha_access_control/list_dashboards",
-        vol.Optional("user_id"): str,
+        vol.Exclusive("user_id", "visibility"): str,
+        vol.Exclusive("all_users", "visibility"): bool,
+        vol.Optional("revision"): vol.Any(str, None),
     }
 )
 @websocket_api.require_admin
@@ -27,118 +28,147 @@ from .const import (
 async def list_dashboards(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
+    user_ids = None
+    if msg.get("all_users"):
+        user_ids = [user["id"] for user in build_user_rows(await hass.auth.async_get_users())]
     user_id = msg.get("user_id")
-    dashboards = await _async_collect_dashboards(
+
+    revision, dashboards = await async_get_dashboards(
         hass,
+        msg.get("revision"),
         user_id if isinstance(user_id, str) and user_id else None,
+        user_ids,
     )
-    connection.send_result(msg["id"], dashboards)
+    if send_not_modified(connection, msg, revision):
+        return
+
+    send_revisioned_result(connection, msg, revision, dashboards)
+
+
+@websocket_api.websocket_command(
+    {vol.Required("type"): "ha_access_control/dashboard_cache_stats"}
+)
+@websocket_api.require_admin
+@callback
+def dashboard_cache_stats(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    connection.send_result(msg["id"], get_dashboard_cache(hass).stats())
 
 
-async def _async_collect_dashboards(
+async def async_get_dashboards(
     hass: HomeAssistant,
+    known_revision: str | None = None,
     user_id: str | None = None,
-) -> list[dict[str, Any]]:
-    dashboards: list[dict[str, Any]] = []
-    seen_ids: set[str] = set()
-
-    dashboards_store = await get_json_file(hass.config.path(LOVELACE_DASHBOARDS_PATH))
-    dashboards_data = dashboards_store.get("data", {}) if isinstance(dashboards_store, dict) else {}
-
-    for dashboard_id, dashboard_info in _extract_dashboard_entries(dashboards_data):
-        dashboard = await _async_build_dashboard_entry(
-            hass,
-            dashboard_id,
-            dashboard_info,
-            user_id,
-        )
-        if dashboard:
-            dashboards.append(dashboard)
-            seen_ids.add(dashboard_id)
-
-    if "lovelace" not in seen_ids:
-        default_dashboard = await _async_build_dashboard_entry(
-            hass,
-            "lovelace",
-            {
-                "title": "Lovelace",
-                "url_path": "lovelace",
-                "filename": LOVELACE_STORAGE,
-            },
-            user_id,
-        )
-        if default_dashboard:
-            dashboards.append(default_dashboard)
-            seen_ids.add("lovelace")
-
-    storage_files = await _async_list_storage_files(hass)
-    for filename in storage_files:
-        if not filename.startswith("lovelace."):
-            continue
-        dashboard_id = filename[len("lovelace.") :]
-        if not dashboard_id or dashboard_id in seen_ids:
-            continue
-        dashboard = await _async_build_dashboard_entry(
-            hass,
-            dashboard_id,
-            {
-                "filename": f"{LOVELACE_STORAGE_DIR}/{filename}",
-                "url_path": dashboard_id,
-            },
-            user_id,
-        )
-        if dashboard:
-            dashboards.append(dashboard)
-            seen_ids.add(dashboard_id)
-
-    return dashboards
+    user_ids: list[str] | None = None,
+) -> tuple[str, Any | None]:
+    """Return ``(revision, dashboards)``, with ``dashboards`` None when ``known_revision`` is current.
+
+    With ``user_ids`` every view lists the indexes in ``users`` of the users
+    who see it, or null for everyone; otherwise it carries ``visible`` for
+    ``user_id``. The revision is checked before any dashboard is read.
+    """
+    repository = get_dashboard_repository(hass)
+    entries = await repository.async_entries()
+    runtime_dashboards = get_runtime_dashboards(hass)
+
+    revision = await _async_listing_revision(
+        repository, entries, runtime_dashboards, user_ids if user_ids is not None else user_id
+    )
+    if revision is not None and revision == known_revision:
+        return revision, None
+
+    user_indexes = {user: index for index, user in enumerate(user_ids)} if user_ids is not None else None
+    dashboards: Any = await gather_with_concurrency(
+        DASHBOARD_IO_CONCURRENCY,
+        (
+            _async_build_dashboard_entry(
+                repository, dashboard_id, dashboard_info, user_id, runtime_dashboards, user_indexes
+            )
+            for dashboard_id, dashboard_info in entries
+        ),
+    )
+    repository.retain_view_summaries(
+        [(dashboard_id, dashboard_filename(dashboard_id, dashboard_info)) for dashboard_id, dashboard_info in entries]
+    )
+    dashboards = [dashboard for dashboard in dashboards if dashboard]
+    if user_ids is not None:
+        dashboards = {"users": user_ids, "dashboards": dashboards}
+
+    if revision is None:
+        revision = content_revision(dashboards)
+        if revision == known_revision:
+            return revision, None
+
+    return revision, dashboards
+
+
+async def _async_listing_revision(
+    repository: DashboardRepository,
+    entries: list[tuple[str, dict[str, Any]]],
+    runtime_dashboards: dict[str, Any],
+    scope: Any,
+) -> str | None:
+    """Revision of a listing derived from its inputs: the dashboard definitions and
+    the fingerprints of their storage files. None when a dashboard only exists in
+    the Lovelace runtime, whose config has no fingerprint."""
+    fingerprints = await gather_with_concurrency(
+        DASHBOARD_IO_CONCURRENCY,
+        (
+            repository.async_storage_fingerprints(dashboard_id, dashboard_filename(dashboard_id, dashboard_info))
+            for dashboard_id, dashboard_info in entries
+        ),
+    )
+    if any(
+        not dashboard_fingerprints and dashboard_id in runtime_dashboards
+        for (dashboard_id, _), dashboard_fingerprints in zip(entries, fingerprints)
+    ):
+        return None
+
+    return content_revision(
+        {
+            "scope": scope,
+            "dashboards": [
+                [dashboard_id, dashboard_info, dashboard_fingerprints]
+                for (dashboard_id, dashboard_info), dashboard_fingerprints in zip(entries, fingerprints)
+            ],
+        }
+    )
 
 
 async def _async_build_dashboard_entry(
-    hass: HomeAssistant,
+    repository: DashboardRepository,
     dashboard_id: str,
     dashboard_info: dict[str, Any],
     user_id: str | None = None,
+    runtime_dashboards: dict[str, Any] | None = None,
+    user_indexes: dict[str, int] | None = None,
 ) -> dict[str, Any] | None:
     if not isinstance(dashboard_info, dict):
         dashboard_info = {}
 
-    filename = dashboard_info.get("filename")
-    if not filename:
-        filename = LOVELACE_STORAGE if dashboard_id == "lovelace" else f"{LOVELACE_STORAGE_PREFIX}{dashboard_id}"
-
-    config = None
-    if dashboard_id == "lovelace":
-        fallback_filename = f"{LOVELACE_STORAGE_PREFIX}lovelace"
-        if filename == LOVELACE_STORAGE:
-            config = await _async_load_dashboard_config(hass, fallback_filename)
-
-        if config is None:
-            config = await _async_load_dashboard_config(hass, filename)
-
-        if config is None and fallback_filename != filename:
-            config = await _async_load_dashboard_config(hass, fallback_filename)
-    else:
-        config = await _async_load_dashboard_config(hass, filename)
+    summary = await repository.async_view_summary(
+        dashboard_id, dashboard_filename(dashboard_id, dashboard_info), runtime_dashboards
+    )
 
     views = []
-    if config:
-        for index, view in enumerate(config.get("views", [])):
-            if not isinstance(view, dict):
-                continue
-
-            view_id = view.get("path") or view.get("id") or f"{dashboard_id}-view-{index}"
-            view_name = view.get("title") or view.get("path") or f"View {index + 1}"
-            views.append(
-                {
-                    "id": view_id,
-                    "name": view_name,
-                    "path": view.get("path"),
-                    "visible": _is_view_visible_for_user(view, user_id),
-                }
-            )
-
-    dashboard_name = dashboard_info.get("title") or (config.get("title") if config else None) or dashboard_id
+    if summary:
+        for view in summary["views"]:
+            index = view["index"]
+            view_id = view["path"] or view["id"] or f"{dashboard_id}-view-{index}"
+            view_name = view["title"] or view["path"] or f"View {index + 1}"
+            view_entry = {
+                "id": view_id,
+                "name": view_name,
+                "path": view["path"],
+            }
+            if user_indexes is not None:
+                view_entry["visible_users"] = _view_visible_user_indexes(view["users"], user_indexes)
+            else:
+                view_entry["visible"] = _is_view_visible_for_user(view["users"], user_id)
+            views.append(view_entry)
+
+    dashboard_name = dashboard_info.get("title") or (summary["title"] if summary else None) or dashboard_id
 
     return {
         "id": dashboard_id,
@@ -149,71 +179,19 @@ async def _async_build_dashboard_entry(
     }
 
 
-async def _async_load_dashboard_config(hass: HomeAssistant, filename: str) -> dict[str, Any] | None:
-    storage = await get_json_file(hass.config.path(filename))
-    if not storage:
-        return None
-
-    data = storage.get("data")
-    if not isinstance(data, dict):
-        return None
-
-    config = data.get("config")
-    return config if isinstance(config, dict) else None
-
-
-async def _async_list_storage_files(hass: HomeAssistant) -> list[str]:
-    storage_dir = hass.config.path(LOVELACE_STORAGE_DIR)
-    try:
-        return await hass.async_add_executor_job(os.listdir, storage_dir)
-    except FileNotFoundError:
-        return []
-
-
-def _extract_dashboard_entries(dashboards_data: dict[str, Any]) -> list[tuple[str, dict[str, Any]]]:
-    if not isinstance(dashboards_data, dict):
-        return []
-
-    entries: list[tuple[str, dict[str, Any]]] = []
-    seen_ids: set[str] = set()
-
-    items = dashboards_data.get("items")
-    if isinstance(items, list):
-        for item in items:
-            if not isinstance(item, dict):
-                continue
-
-            dashboard_id = item.get("id")
-            if not isinstance(dashboard_id, str) or not dashboard_id or dashboard_id in seen_ids:
-                continue
-
-            entries.append((dashboard_id, item))
-            seen_ids.add(dashboard_id)
-
-    dashboards = dashboards_data.get("dashboards")
-    if isinstance(dashboards, dict):
-        for dashboard_id, dashboard_info in dashboards.items():
-            if not isinstance(dashboard_id, str) or not dashboard_id or dashboard_id in seen_ids:
-                continue
-
-            entries.append((dashboard_id, dashboard_info if isinstance(dashboard_info, dict) else {}))
-            seen_ids.add(dashboard_id)
-
-    return entries
-
-
-def _is_view_visible_for_user(view: dict[str, Any], user_id: str | None) -> bool:
+def _is_view_visible_for_user(view_users: list[str] | None, user_id: str | None) -> bool:
     if not user_id:
         return False
 
-    visible = view.get("visible")
-    if visible is None:
+    if view_users is None:
         return True
 
-    if not isinstance(visible, list):
-        return False
+    return user_id in view_users
 
-    return any(
-        isinstance(entry, dict) and entry.get("user") == user_id
-        for entry in visible
-    )
+
+def _view_visible_user_indexes(view_users: list[str] | None, user_indexes: dict[str, int]) -> list[int] | None:
+    """``_is_view_visible_for_user`` for every user at once; ``None`` when unrestricted."""
+    if view_users is None:
+        return None
+
+    return sorted({user_indexes[user] for user in view_users if user in user_indexes})
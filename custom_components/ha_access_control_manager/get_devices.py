@@ -1,37 +1,47 @@
+import asyncio
+from collections.abc import Iterator
 from typing import Any
 import voluptuous as vol
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.components import websocket_api
 from homeassistant.helpers import area_registry as ar
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
-from homeassistant.loader import IntegrationNotFound, async_get_integration
 
 try:
     from homeassistant.helpers import label_registry as lr
 except ImportError:  # pragma: no cover - older Home Assistant versions
     lr = None
 
-
-async def _resolve_integration_name(
-    hass: HomeAssistant, domain: str, cache: dict[str, str]
-) -> str:
-    """Resolve a human-readable integration name from a domain."""
-    if domain in cache:
-        return cache[domain]
-
-    try:
-        integration = await async_get_integration(hass, domain)
-        name = integration.name
-    except IntegrationNotFound:
-        name = domain
-
-    cache[domain] = name
-    return name
-
-
-async def _resolve_device_integrations(
-    hass: HomeAssistant, config_entry_ids, cache: dict[str, str]
+from .columnar import (
+    ENCODE_OBJECTS,
+    ENCODE_STRING,
+    FORMAT_SCHEMA,
+    ColumnarEncoder,
+    encode_rows,
+    format_extra,
+    wants_columnar,
+)
+from .const import DATA_DEVICE_SNAPSHOT, DOMAIN, MAX_CACHED_PROJECTIONS
+from .integration_names import IntegrationNameCache, get_integration_names
+from .lookups import RegistryLookups, get_registry_lookups
+from .projection import PANEL_DEVICE_FIELDS, PANEL_ENTITY_FIELDS, PROJECTION_SCHEMA, Projection, project, resolve_projection
+from .revisions import REVISION_DEVICES, get_revision_tracker, send_not_modified, send_revisioned_result
+from .table_query import (
+    QUERY_SCHEMA,
+    InvalidQuery,
+    RowDescription,
+    TableSpec,
+    async_get_table_index,
+    none_if_empty,
+    query_table,
+    revision_extra,
+    wants_query,
+)
+
+
+def _resolve_device_integrations(
+    hass: HomeAssistant, config_entry_ids, integration_names: IntegrationNameCache
 ) -> list[dict[str, str]]:
     """Resolve integration labels from linked config entries."""
     integrations: list[dict[str, str]] = []
@@ -39,31 +49,15 @@ async def _resolve_device_integrations(
 
     for entry_id in config_entry_ids:
         entry = hass.config_entries.async_get_entry(entry_id)
-        if entry is None:
-            continue
-
-        label = await _resolve_integration_name(hass, entry.domain, cache)
-        if entry.domain in seen:
+        if entry is None or entry.domain in seen:
             continue
 
         seen.add(entry.domain)
-        integrations.append({"domain": entry.domain, "name": label})
+        integrations.append({"domain": entry.domain, "name": integration_names.name(entry.domain)})
 
     return integrations
 
 
-def _resolve_area_name(area_registry, area_id: str | None) -> str | None:
-    """Resolve area name from area registry."""
-    if not area_id:
-        return None
-
-    area_entry = area_registry.async_get_area(area_id)
-    if area_entry is None:
-        return None
-
-    return area_entry.name
-
-
 def _registry_value(value) -> str | None:
     """Return a JSON-compatible registry enum value."""
     if value is None:
@@ -72,34 +66,18 @@ def _registry_value(value) -> str | None:
     return getattr(value, "value", value)
 
 
-def _label_entries(label_registry, label_ids) -> list[dict[str, str]]:
-    """Resolve label IDs to names while keeping the ID for filtering."""
-    labels: list[dict[str, str]] = []
-    for label_id in sorted(label_ids or []):
-        label = label_registry.async_get_label(label_id) if label_registry else None
-        labels.append(
-            {
-                "id": label_id,
-                "name": label.name if label is not None else label_id,
-            }
-        )
-
-    return labels
-
-
-async def convert_device_entry(
+def convert_device_entry(
     hass: HomeAssistant,
-    area_registry,
-    label_registry,
+    lookups: RegistryLookups,
     device,
-    integration_name_cache: dict[str, str],
+    integration_names: IntegrationNameCache,
 ):
     """Convertit un DeviceEntry en dictionnaire JSON-compatible."""
-    integrations = await _resolve_device_integrations(
-        hass, device.config_entries, integration_name_cache
+    integrations = _resolve_device_integrations(
+        hass, device.config_entries, integration_names
     )
     integration = ", ".join(item["name"] for item in integrations) or None
-    area = _resolve_area_name(area_registry, device.area_id)
+    area = lookups.area_name(device.area_id)
 
     return {
         "id": device.id,
@@ -122,11 +100,11 @@ async def convert_device_entry(
         "area": area,
         "integration": integration,
         "integrations": integrations,
-        "labels": _label_entries(label_registry, getattr(device, "labels", [])),
+        "labels": lookups.labels(getattr(device, "labels", [])),
         "entities": []  # Initialisation de la liste des entités associées
     }
 
-def convert_entity_entry(entity, area_registry, label_registry):
+def convert_entity_entry(entity, lookups: RegistryLookups):
     """Convertit un EntityEntry en dictionnaire JSON-compatible."""
     area_id = getattr(entity, "area_id", None)
 
@@ -141,33 +119,18 @@ def convert_entity_entry(entity, area_registry, label_registry):
         "hidden_by": _registry_value(getattr(entity, "hidden_by", None)),
         "original_name": entity.original_name,
         "area_id": area_id,
-        "area": _resolve_area_name(area_registry, area_id),
-        "labels": _label_entries(label_registry, getattr(entity, "labels", [])),
+        "area": lookups.area_name(area_id),
+        "labels": lookups.labels(getattr(entity, "labels", [])),
         "categories": dict(getattr(entity, "categories", {}) or {}),
     }
 
-@websocket_api.websocket_command({vol.Required("type"): "ha_access_control/list_devices"})
-@websocket_api.require_admin
-@websocket_api.async_response
-async def list_devices(
-    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
-) -> None:
-    device_registry = dr.async_get(hass)
-    entity_registry = er.async_get(hass)
-    area_registry = ar.async_get(hass)
-    label_registry = lr.async_get(hass) if lr else None
-    integration_name_cache: dict[str, str] = {}
-
-    # Récupération des devices sous forme de dictionnaire (id -> objet JSON)
-    devices = {}
-    for device in device_registry.devices.values():
-        devices[device.id] = await convert_device_entry(
-            hass, area_registry, label_registry, device, integration_name_cache
-        )
+WITHOUT_DEVICES_ID = "withoutDevices"
+
 
-    # Initialisation du "device" fictif pour les entités sans device
-    without_devices = {
-        "id": "withoutDevices",
+def _build_without_devices(entities: list[dict[str, Any]]) -> dict[str, Any]:
+    """Build the virtual device grouping entities that have no device."""
+    return {
+        "id": WITHOUT_DEVICES_ID,
         "name": "Entities without Devices",
         "manufacturer": "Home Assistant",
         "model": "Virtual",
@@ -185,24 +148,450 @@ async def list_devices(
         "area_id": None,
         "area": None,
         "integration": None,
-        "entities": []
+        "entities": entities,
     }
 
-    # Récupération des entités et association aux devices
-    for entity in entity_registry.entities.values():
-        entity_data = convert_entity_entry(entity, area_registry, label_registry)
-        device_id = entity_data["device_id"]
 
+def assemble_device_tree(
+    devices: dict[str, dict[str, Any]], entities: dict[str, dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """Nest serialized entities under their devices, as ``list_devices`` returns them."""
+    return list(iter_device_tree(devices, entities))
+
+
+def iter_device_tree(
+    devices: dict[str, dict[str, Any]], entities: dict[str, dict[str, Any]]
+) -> Iterator[dict[str, Any]]:
+    """Yield the rows of ``assemble_device_tree`` one device at a time."""
+    entities_by_device: dict[str, list[dict[str, Any]]] = {}
+    without_devices: list[dict[str, Any]] = []
+    for entity_data in entities.values():
+        device_id = entity_data["device_id"]
         if device_id and device_id in devices:
-            devices[device_id]["entities"].append(entity_data)
+            entities_by_device.setdefault(device_id, []).append(entity_data)
         else:
-            # Ajouter dans le device fictif si pas de device associé
-            without_devices["entities"].append(entity_data)
+            without_devices.append(entity_data)
+
+    for device_id, device_data in devices.items():
+        yield {**device_data, "entities": entities_by_device.get(device_id, [])}
+
+    if without_devices:
+        yield _build_without_devices(without_devices)
+
+
+DEVICE_COLUMN_ENCODINGS = {
+    "manufacturer": ENCODE_STRING,
+    "model": ENCODE_STRING,
+    "entry_type": ENCODE_STRING,
+    "disabled_by": ENCODE_STRING,
+    "area_id": ENCODE_STRING,
+    "area": ENCODE_STRING,
+    "integration": ENCODE_STRING,
+    "integrations": ENCODE_OBJECTS,
+    "labels": ENCODE_OBJECTS,
+}
+ENTITY_COLUMN_ENCODINGS = {
+    "domain": ENCODE_STRING,
+    "platform": ENCODE_STRING,
+    "device_id": ENCODE_STRING,
+    "disabled_by": ENCODE_STRING,
+    "hidden_by": ENCODE_STRING,
+    "area_id": ENCODE_STRING,
+    "area": ENCODE_STRING,
+    "labels": ENCODE_OBJECTS,
+}
+
+
+def encode_device_tree(devices_list: list[dict[str, Any]]) -> dict[str, Any]:
+    """Columnar payload of a device tree: a ``devices`` table and, when nested, an
+    ``entities`` table whose ``parent`` holds each entity's device row."""
+    encoder = ColumnarEncoder()
+    device_rows: list[dict[str, Any]] = []
+    entity_rows: list[dict[str, Any]] = []
+    parents: list[int] = []
+    nested = False
+
+    for position, device_data in enumerate(devices_list):
+        if "entities" not in device_data:
+            device_rows.append(device_data)
+            continue
+
+        nested = True
+        device_rows.append({key: value for key, value in device_data.items() if key != "entities"})
+        entity_rows.extend(device_data["entities"])
+        parents.extend([position] * len(device_data["entities"]))
+
+    tables = {"devices": encoder.encode_table(device_rows, DEVICE_COLUMN_ENCODINGS)}
+    if nested:
+        tables["entities"] = {
+            **encoder.encode_table(entity_rows, ENTITY_COLUMN_ENCODINGS),
+            "parent": parents,
+        }
+    return encoder.payload(**tables)
+
+
+class DeviceRegistrySnapshot:
+    """Serialized device/entity tree kept in step with the registries.
+
+    Registry update events only mark the touched devices and entities dirty;
+    the next ``async_get`` re-serializes those entries and reassembles the
+    payload instead of converting both registries on every call.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._lock = asyncio.Lock()
+        self._devices: dict[str, dict[str, Any]] = {}
+        self._entities: dict[str, dict[str, Any]] = {}
+        self._needs_rebuild = True
+        self._integration_names_version = -1
+        self._dirty_device_ids: set[str] = set()
+        self._dirty_entity_ids: set[str] = set()
+        self._payload: list[dict[str, Any]] | None = None
+        self._projected_payloads: dict[tuple[str | None, bool], Any] = {}
+
+        hass.bus.async_listen(dr.EVENT_DEVICE_REGISTRY_UPDATED, self._async_device_updated)
+        hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_entity_updated)
+        hass.bus.async_listen(ar.EVENT_AREA_REGISTRY_UPDATED, self._async_area_updated)
+        if lr is not None:
+            hass.bus.async_listen(lr.EVENT_LABEL_REGISTRY_UPDATED, self._async_label_updated)
+
+    async def async_entries(self) -> tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]]]:
+        """Return up-to-date copies of the serialized devices and entities, keyed by id.
+
+        Entries that did not change since a previous call are the very same
+        objects, so callers can diff two results by identity.
+        """
+        async with self._lock:
+            await self._async_refresh()
+            return dict(self._devices), dict(self._entities)
+
+    async def async_get(self, projection: Projection | None = None, columnar: bool = False) -> Any:
+        """Return the device tree, projected and columnar encoded if requested."""
+        async with self._lock:
+            await self._async_refresh()
+
+            if self._payload is None:
+                self._payload = self._assemble()
+                self._projected_payloads = {}
+
+            projection_key = projection.key if projection is not None else None
+            if projection_key is None and not columnar:
+                return self._payload
+
+            cache_key = (projection_key, columnar)
+            payload = self._projected_payloads.get(cache_key)
+            if payload is None:
+                if len(self._projected_payloads) >= MAX_CACHED_PROJECTIONS:
+                    self._projected_payloads.clear()
+                payload = self._payload if projection_key is None else self._project(projection)
+                if columnar:
+                    payload = encode_device_tree(payload)
+                self._projected_payloads[cache_key] = payload
+
+            return payload
+
+    async def _async_refresh(self) -> None:
+        # Resolve any new config entry domain up front so conversion never awaits.
+        integration_names = get_integration_names(self._hass)
+        await integration_names.async_ensure(integration_names.config_entry_domains())
+        if integration_names.version != self._integration_names_version:
+            self._needs_rebuild = True
+
+        if self._needs_rebuild:
+            self._rebuild(integration_names)
+        elif self._dirty_device_ids or self._dirty_entity_ids:
+            self._patch(integration_names)
+
+    def _rebuild(self, integration_names: IntegrationNameCache) -> None:
+        self._needs_rebuild = False
+        self._integration_names_version = integration_names.version
+        self._dirty_device_ids.clear()
+        self._dirty_entity_ids.clear()
+        self._payload = None
+
+        lookups = get_registry_lookups(self._hass)
+
+        self._devices = {
+            device.id: convert_device_entry(self._hass, lookups, device, integration_names)
+            for device in dr.async_get(self._hass).devices.values()
+        }
+        self._entities = {
+            entity.entity_id: convert_entity_entry(entity, lookups)
+            for entity in er.async_get(self._hass).entities.values()
+        }
+
+    def _patch(self, integration_names: IntegrationNameCache) -> None:
+        device_ids = self._dirty_device_ids
+        entity_ids = self._dirty_entity_ids
+        self._dirty_device_ids = set()
+        self._dirty_entity_ids = set()
+        self._payload = None
+
+        device_registry = dr.async_get(self._hass)
+        entity_registry = er.async_get(self._hass)
+        lookups = get_registry_lookups(self._hass)
+
+        for device_id in device_ids:
+            device = device_registry.async_get(device_id)
+            if device is None:
+                self._devices.pop(device_id, None)
+                continue
+
+            self._devices[device_id] = convert_device_entry(
+                self._hass, lookups, device, integration_names
+            )
+
+        for entity_id in entity_ids:
+            entity = entity_registry.async_get(entity_id)
+            if entity is None:
+                self._entities.pop(entity_id, None)
+                continue
+
+            self._entities[entity_id] = convert_entity_entry(entity, lookups)
+
+    def _assemble(self) -> list[dict[str, Any]]:
+        return assemble_device_tree(self._devices, self._entities)
+
+    def _project(self, projection: Projection) -> list[dict[str, Any]]:
+        return [project_device(device_data, projection) for device_data in self._payload]
+
+    @callback
+    def _async_device_updated(self, event: Event) -> None:
+        self._mark_dirty(device_ids=[event.data.get("device_id")])
+
+    @callback
+    def _async_entity_updated(self, event: Event) -> None:
+        self._mark_dirty(entity_ids=[event.data.get("entity_id"), event.data.get("old_entity_id")])
+
+    @callback
+    def _async_area_updated(self, event: Event) -> None:
+        area_id = event.data.get("area_id")
+        self._mark_dirty(
+            device_ids=[key for key, item in self._devices.items() if item["area_id"] == area_id],
+            entity_ids=[key for key, item in self._entities.items() if item["area_id"] == area_id],
+        )
+
+    @callback
+    def _async_label_updated(self, event: Event) -> None:
+        label_id = event.data.get("label_id")
+
+        def _has_label(item: dict[str, Any]) -> bool:
+            return any(label["id"] == label_id for label in item["labels"])
+
+        self._mark_dirty(
+            device_ids=[key for key, item in self._devices.items() if _has_label(item)],
+            entity_ids=[key for key, item in self._entities.items() if _has_label(item)],
+        )
+
+    @callback
+    def _mark_dirty(self, device_ids=(), entity_ids=()) -> None:
+        if self._needs_rebuild:
+            return
+
+        self._dirty_device_ids.update(device_id for device_id in device_ids if device_id)
+        self._dirty_entity_ids.update(entity_id for entity_id in entity_ids if entity_id)
+        if self._dirty_device_ids or self._dirty_entity_ids:
+            self._payload = None
+
+
+def get_device_snapshot(hass: HomeAssistant) -> DeviceRegistrySnapshot:
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    snapshot = domain_data.get(DATA_DEVICE_SNAPSHOT)
+    if snapshot is None:
+        snapshot = domain_data[DATA_DEVICE_SNAPSHOT] = DeviceRegistrySnapshot(hass)
+
+    return snapshot
+
+
+def _integration_names(item: dict[str, Any]) -> list[str]:
+    names = [integration["name"] for integration in item.get("integrations") or [] if integration.get("name")]
+    if names:
+        return names
+
+    return [item["integration"]] if item.get("integration") else []
+
+
+def _status_values(item: dict[str, Any], can_hide: bool) -> list[str]:
+    values = ["disabled" if item.get("disabled_by") else "enabled"]
+    if not can_hide or not item.get("hidden_by"):
+        values.append("visible")
+    else:
+        values.append("hidden")
+
+    return values
 
-    # Transformer le dictionnaire en liste et ajouter le device "withoutDevices" si nécessaire
-    devices_list = list(devices.values())
-    if without_devices["entities"]:
-        devices_list.append(without_devices)
 
-    # Envoi des données converties
-    connection.send_result(msg["id"], devices_list)
+def _describe_device_row(device: dict[str, Any]) -> RowDescription:
+    entities = device["entities"]
+    # Same fallback as the panel: a device without an area shows its first entity area.
+    area = device.get("area") or next((entity["area"] for entity in entities if entity.get("area")), None)
+    integration = device.get("integration") or ", ".join(
+        dict.fromkeys(entity["platform"] for entity in entities if entity.get("platform"))
+    )
+
+    return RowDescription(
+        (device["name"], integration, area),
+        {
+            "areas": none_if_empty(area),
+            "integrations": _integration_names(device) or ([integration] if integration else []),
+            "labels": [label["id"] for label in device["labels"]],
+            "domains": {entity["domain"] for entity in entities if entity.get("domain")},
+            "status": _status_values(device, can_hide=False),
+        },
+        {"name": device["name"], "area": area, "integration": integration},
+    )
+
+
+def _describe_entity_row(entity: dict[str, Any]) -> RowDescription:
+    return RowDescription(
+        (
+            entity["name"], entity["original_name"], entity["entity_id"],
+            entity["device_name"], entity["integration"], entity["area"],
+        ),
+        {
+            "areas": none_if_empty(entity["area"]),
+            "integrations": _integration_names(entity),
+            "devices": none_if_empty(entity["device_id"] if entity["device_name"] else None),
+            "domains": [entity["domain"]] if entity.get("domain") else [],
+            "labels": [label["id"] for label in entity["labels"]],
+            "status": _status_values(entity, can_hide=True),
+        },
+        {
+            "name": entity["name"],
+            "entity_id": entity["entity_id"],
+            "device_name": entity["device_name"],
+            "area": entity["area"],
+            "integration": entity["integration"],
+            "domain": entity["domain"],
+        },
+    )
+
+
+DEVICE_TABLE = TableSpec(
+    "devices",
+    ("areas", "integrations", "labels", "domains", "status"),
+    ("name", "area", "integration"),
+    _describe_device_row,
+)
+ENTITY_TABLE = TableSpec(
+    "entities",
+    ("areas", "integrations", "devices", "domains", "labels", "status"),
+    ("name", "entity_id", "device_name", "area", "integration", "domain"),
+    _describe_entity_row,
+)
+# Entity table rows carry these device columns on top of the entity fields.
+ENTITY_ROW_DEVICE_FIELDS = frozenset({"device_name", "integration", "integrations"})
+ENTITY_ROW_COLUMN_ENCODINGS = {
+    **ENTITY_COLUMN_ENCODINGS,
+    "device_name": ENCODE_STRING,
+    "integration": ENCODE_STRING,
+    "integrations": ENCODE_OBJECTS,
+}
+
+
+def _build_entity_rows(devices_list: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    rows = []
+    for device_data in devices_list:
+        is_virtual = device_data["id"] == WITHOUT_DEVICES_ID
+        for entity_data in device_data["entities"]:
+            rows.append(
+                {
+                    **entity_data,
+                    "area": entity_data["area"] or (None if is_virtual else device_data["area"]),
+                    "device_name": None if is_virtual else device_data["name"],
+                    "integration": (None if is_virtual else device_data["integration"]) or entity_data["platform"],
+                    "integrations": [] if is_virtual else device_data["integrations"],
+                }
+            )
+
+    return rows
+
+
+async def _async_query_devices(
+    hass: HomeAssistant, msg: dict[str, Any], projection: Projection
+) -> dict[str, Any]:
+    snapshot = get_device_snapshot(hass)
+    table_revision = get_revision_tracker(hass).token(REVISION_DEVICES)
+
+    if msg.get("rows") == "entities":
+        async def _async_entity_rows() -> list[dict[str, Any]]:
+            return _build_entity_rows(await snapshot.async_get())
+
+        index = await async_get_table_index(hass, ENTITY_TABLE, table_revision, _async_entity_rows)
+        page = query_table(index, msg)
+        if projection.entity_fields is not None:
+            fields = projection.entity_fields | ENTITY_ROW_DEVICE_FIELDS
+            page["items"] = [project(row, fields) for row in page["items"]]
+        return page
+
+    async def _async_device_rows() -> list[dict[str, Any]]:
+        # Entities without a device are only listed in the entity table, as in the panel.
+        return [
+            device_data
+            for device_data in await snapshot.async_get()
+            if device_data["id"] != WITHOUT_DEVICES_ID
+        ]
+
+    index = await async_get_table_index(hass, DEVICE_TABLE, table_revision, _async_device_rows)
+    page = query_table(index, msg)
+    page["items"] = [
+        project_device(device_data, projection) for device_data in page["items"]
+    ]
+    return page
+
+
+def project_device(device_data: dict[str, Any], projection: Projection) -> dict[str, Any]:
+    projected = project(device_data, projection.fields)
+    if projection.entity_fields is not None and "entities" in projected:
+        projected = {
+            **projected,
+            "entities": [
+                project(entity_data, projection.entity_fields)
+                for entity_data in device_data["entities"]
+            ],
+        }
+
+    return projected
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "ha_access_control/list_devices",
+        vol.Optional("revision"): vol.Any(str, None),
+        vol.Optional("rows"): vol.In(["devices", "entities"]),
+        **PROJECTION_SCHEMA,
+        **QUERY_SCHEMA,
+        **FORMAT_SCHEMA,
+    }
+)
+@websocket_api.require_admin
+@websocket_api.async_response
+async def list_devices(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    projection = resolve_projection(msg, PANEL_DEVICE_FIELDS, PANEL_ENTITY_FIELDS)
+    revision = get_revision_tracker(hass).token(
+        REVISION_DEVICES, extra=format_extra(msg, revision_extra(msg, projection.key))
+    )
+    if send_not_modified(connection, msg, revision):
+        return
+
+    if wants_query(msg):
+        try:
+            page = await _async_query_devices(hass, msg, projection)
+        except InvalidQuery as err:
+            connection.send_error(msg["id"], "invalid_query", str(err))
+            return
+
+        if wants_columnar(msg):
+            page["items"] = (
+                encode_rows(page["items"], ENTITY_ROW_COLUMN_ENCODINGS)
+                if msg.get("rows") == "entities"
+                else encode_device_tree(page["items"])
+            )
+        send_revisioned_result(connection, msg, revision, page)
+        return
+
+    devices_list = await get_device_snapshot(hass).async_get(projection, wants_columnar(msg))
+    send_revisioned_result(connection, msg, revision, devices_list)
@@ -1,21 +1,27 @@
+from collections.abc import Iterator
 from typing import Any
 
 import voluptuous as vol
 from homeassistant.components import websocket_api
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers import area_registry as ar
-from homeassistant.helpers import device_registry as dr
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
 
-try:
-    from homeassistant.helpers import category_registry as cr
-except ImportError:  # pragma: no cover - older Home Assistant versions
-    cr = None
-
-try:
-    from homeassistant.helpers import label_registry as lr
-except ImportError:  # pragma: no cover - older Home Assistant versions
-    lr = None
+from .const import DATA_HELPER_INDEX, DOMAIN
+from .columnar import ENCODE_OBJECTS, ENCODE_STRING, FORMAT_SCHEMA, encode_rows, format_extra, wants_columnar
+from .lookups import RegistryLookups, get_registry_lookups
+from .revisions import REVISION_HELPERS, get_revision_tracker, send_not_modified, send_revisioned_result
+from .projection import PANEL_HELPER_FIELDS, PROJECTION_SCHEMA, Projection, project, resolve_projection
+from .table_query import (
+    QUERY_SCHEMA,
+    InvalidQuery,
+    RowDescription,
+    TableSpec,
+    async_get_table_index,
+    none_if_empty,
+    query_table,
+    revision_extra,
+    wants_query,
+)
 
 
 HELPER_DOMAINS = {
@@ -42,20 +48,6 @@ def _registry_value(value) -> str | None:
     return getattr(value, "value", value)
 
 
-def _label_entries(label_registry, label_ids) -> list[dict[str, str]]:
-    labels: list[dict[str, str]] = []
-    for label_id in sorted(label_ids or []):
-        label = label_registry.async_get_label(label_id) if label_registry else None
-        labels.append(
-            {
-                "id": label_id,
-                "name": label.name if label is not None else label_id,
-            }
-        )
-
-    return labels
-
-
 def _voice_assistants(entity) -> list[dict[str, str]]:
     options = getattr(entity, "options", {}) or {}
     assistants: list[dict[str, str]] = []
@@ -67,33 +59,6 @@ def _voice_assistants(entity) -> list[dict[str, str]]:
     return assistants
 
 
-def _resolve_device_name(device_registry, device_id: str | None) -> str | None:
-    if not device_id:
-        return None
-
-    device_entry = device_registry.async_get(device_id)
-    if device_entry is None:
-        return None
-
-    return getattr(device_entry, "name_by_user", None) or device_entry.name or device_entry.id
-
-
-def _resolve_helper_category(category_registry, category_id: str | None) -> str | None:
-    if category_registry is None:
-        return None
-
-    if not category_id:
-        return None
-
-    category = category_registry.async_get_category(
-        scope="helpers", category_id=category_id
-    )
-    if category is None:
-        return None
-
-    return category.name
-
-
 def _classify_helper(entity) -> tuple[bool, str | None]:
     domain = getattr(entity, "domain", None) or entity.entity_id.split(".", 1)[0]
 
@@ -109,9 +74,56 @@ def _classify_helper(entity) -> tuple[bool, str | None]:
     return False, None
 
 
-def _convert_helper_entity(
-    entity, helper_type: str, label_registry, category_registry
-) -> dict[str, Any]:
+class HelperIndex:
+    """Helper type of every helper entity, keyed by entity id.
+
+    Built from one registry scan, then kept current from entity registry
+    events, so listing helpers costs the number of helpers, not of entities.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._entity_registry = er.async_get(hass)
+        self._helper_types: dict[str, str] = {}
+        for entity in self._entity_registry.entities.values():
+            self._classify(entity)
+
+        hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_entity_updated)
+
+    def items(self) -> list[tuple[str, str]]:
+        return list(self._helper_types.items())
+
+    def _classify(self, entity) -> None:
+        is_helper, helper_type = _classify_helper(entity)
+        if is_helper and helper_type is not None:
+            self._helper_types[entity.entity_id] = helper_type
+        else:
+            self._helper_types.pop(entity.entity_id, None)
+
+    @callback
+    def _async_entity_updated(self, event: Event) -> None:
+        entity_id = event.data.get("entity_id")
+        old_entity_id = event.data.get("old_entity_id")
+        if old_entity_id:
+            self._helper_types.pop(old_entity_id, None)
+
+        entity = self._entity_registry.async_get(entity_id) if entity_id else None
+        if entity is None:
+            self._helper_types.pop(entity_id, None)
+            return
+
+        self._classify(entity)
+
+
+def get_helper_index(hass: HomeAssistant) -> HelperIndex:
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    index = domain_data.get(DATA_HELPER_INDEX)
+    if index is None:
+        index = domain_data[DATA_HELPER_INDEX] = HelperIndex(hass)
+
+    return index
+
+
+def _convert_helper_entity(entity, helper_type: str, lookups: RegistryLookups) -> dict[str, Any]:
     area_id = getattr(entity, "area_id", None)
     categories = dict(getattr(entity, "categories", {}) or {})
     category_id = categories.get("helpers")
@@ -127,59 +139,127 @@ def _convert_helper_entity(
         "area_id": area_id,
         "disabled_by": _registry_value(getattr(entity, "disabled_by", None)),
         "hidden_by": _registry_value(getattr(entity, "hidden_by", None)),
-        "labels": _label_entries(label_registry, getattr(entity, "labels", [])),
+        "labels": lookups.labels(getattr(entity, "labels", [])),
         "categories": categories,
         "category_id": category_id,
-        "category_name": _resolve_helper_category(category_registry, category_id),
+        "category_name": lookups.helper_category_name(category_id),
         "voice_assistants": _voice_assistants(entity),
     }
 
 
-def _resolve_helper_area(
-    area_registry, device_registry, helper: dict[str, Any]
-) -> str | None:
-    area_id = helper.get("area_id")
-
-    if not area_id:
-        device_id = helper.get("device_id")
-        if device_id:
-            device_entry = device_registry.async_get(device_id)
-            if device_entry is not None:
-                area_id = device_entry.area_id
-
-    if not area_id:
-        return None
+def _describe_helper_row(helper: dict[str, Any]) -> RowDescription:
+    return RowDescription(
+        (
+            helper["name"], helper["entity_id"], helper["helper_type"], helper["area"],
+            helper["device_name"], helper["category_name"],
+        ),
+        {
+            "areas": none_if_empty(helper["area"]),
+            "devices": none_if_empty(helper["device_id"]),
+            "domains": [helper["domain"]],
+            "labels": [label["id"] for label in helper["labels"]],
+            "categories": none_if_empty(helper["category_id"]),
+            "voice_assistants": [assistant["id"] for assistant in helper["voice_assistants"]],
+            "status": [
+                "disabled" if helper["disabled_by"] else "enabled",
+                "hidden" if helper["hidden_by"] else "visible",
+            ],
+        },
+        {
+            "name": helper["name"],
+            "entity_id": helper["entity_id"],
+            "helper_type": helper["helper_type"],
+            "area": helper["area"],
+            "device_name": helper["device_name"],
+            "category": helper["category_name"],
+        },
+    )
 
-    area_entry = area_registry.async_get_area(area_id)
-    if area_entry is None:
-        return None
 
-    return area_entry.name
+HELPER_TABLE = TableSpec(
+    "helpers",
+    ("areas", "devices", "domains", "labels", "categories", "voice_assistants", "status"),
+    ("name", "entity_id", "helper_type", "area", "device_name", "category"),
+    _describe_helper_row,
+)
+HELPER_COLUMN_ENCODINGS = {
+    "platform": ENCODE_STRING,
+    "domain": ENCODE_STRING,
+    "helper_type": ENCODE_STRING,
+    "device_id": ENCODE_STRING,
+    "device_name": ENCODE_STRING,
+    "area_id": ENCODE_STRING,
+    "area": ENCODE_STRING,
+    "disabled_by": ENCODE_STRING,
+    "hidden_by": ENCODE_STRING,
+    "category_id": ENCODE_STRING,
+    "category_name": ENCODE_STRING,
+    "labels": ENCODE_OBJECTS,
+    "voice_assistants": ENCODE_OBJECTS,
+}
 
 
-@websocket_api.websocket_command({vol.Required("type"): "ha_access_control/list_helpers"})
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "ha_access_control/list_helpers",
+        vol.Optional("revision"): vol.Any(str, None),
+        **PROJECTION_SCHEMA,
+        **QUERY_SCHEMA,
+        **FORMAT_SCHEMA,
+    }
+)
 @websocket_api.require_admin
 @websocket_api.async_response
 async def list_helpers(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    entity_registry = er.async_get(hass)
-    device_registry = dr.async_get(hass)
-    area_registry = ar.async_get(hass)
-    label_registry = lr.async_get(hass) if lr else None
-    category_registry = cr.async_get(hass) if cr else None
+    projection = resolve_projection(msg, PANEL_HELPER_FIELDS)
+    revision = get_revision_tracker(hass).token(
+        REVISION_HELPERS, extra=format_extra(msg, revision_extra(msg, projection.key))
+    )
+    if send_not_modified(connection, msg, revision):
+        return
 
-    helpers: list[dict[str, Any]] = []
-    for entity in entity_registry.entities.values():
-        is_helper, helper_type = _classify_helper(entity)
-        if not is_helper or helper_type is None:
-            continue
+    if wants_query(msg):
+        async def _async_rows() -> list[dict[str, Any]]:
+            return list(_iter_helpers(hass, Projection(None)))
 
-        helper = _convert_helper_entity(
-            entity, helper_type, label_registry, category_registry
+        index = await async_get_table_index(
+            hass, HELPER_TABLE, get_revision_tracker(hass).token(REVISION_HELPERS), _async_rows
         )
-        helper["area"] = _resolve_helper_area(area_registry, device_registry, helper)
-        helper["device_name"] = _resolve_device_name(device_registry, entity.device_id)
-        helpers.append(helper)
+        try:
+            page = query_table(index, msg)
+        except InvalidQuery as err:
+            connection.send_error(msg["id"], "invalid_query", str(err))
+            return
+
+        page["items"] = [project(helper, projection.fields) for helper in page["items"]]
+        if wants_columnar(msg):
+            page["items"] = encode_rows(page["items"], HELPER_COLUMN_ENCODINGS)
+        send_revisioned_result(connection, msg, revision, page)
+        return
+
+    helpers = list(_iter_helpers(hass, projection))
+    if wants_columnar(msg):
+        helpers = encode_rows(helpers, HELPER_COLUMN_ENCODINGS)
+    send_revisioned_result(connection, msg, revision, helpers)
+
+
+def _iter_helpers(hass: HomeAssistant, projection: Projection) -> Iterator[dict[str, Any]]:
+    """Yield serialized helpers in helper index order."""
+    entity_registry = er.async_get(hass)
+    lookups = get_registry_lookups(hass)
+
+    # The index follows registry events, so it can still list a helper that
+    # was just removed: skip those.
+    for entity_id, helper_type in get_helper_index(hass).items():
+        entity = entity_registry.async_get(entity_id)
+        if entity is None:
+            continue
 
-    connection.send_result(msg["id"], helpers)
+        helper = _convert_helper_entity(entity, helper_type, lookups)
+        if projection.wants("area"):
+            helper["area"] = lookups.entity_area_name(helper["area_id"], entity.device_id)
+        if projection.wants("device_name"):
+            helper["device_name"] = lookups.device_name(entity.device_id)
+        yield project(helper, projection.fields)
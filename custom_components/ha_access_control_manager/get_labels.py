@@ -9,8 +9,15 @@ try:
 except ImportError:  # pragma: no cover - older Home Assistant versions
     lr = None
 
+from .revisions import REVISION_LABELS, get_revision_tracker, send_not_modified, send_revisioned_result
 
-@websocket_api.websocket_command({vol.Required("type"): "ha_access_control/list_labels"})
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "ha_access_control/list_labels",
+        vol.Optional("revision"): vol.Any(str, None),
+    }
+)
 @websocket_api.require_admin
 @websocket_api.async_response
 async def list_labels(
@@ -18,10 +25,17 @@ async def list_labels(
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
 ) -> None:
-    if lr is None:
-        connection.send_result(msg["id"], [])
+    revision = get_revision_tracker(hass).token(REVISION_LABELS)
+    if send_not_modified(connection, msg, revision):
         return
 
+    send_revisioned_result(connection, msg, revision, build_label_rows(hass))
+
+
+def build_label_rows(hass: HomeAssistant) -> list[dict[str, Any]]:
+    if lr is None:
+        return []
+
     label_registry = lr.async_get(hass)
     labels = [
         {
@@ -32,4 +46,4 @@ async def list_labels(
     ]
 
     labels.sort(key=lambda label: label["name"].lower())
-    connection.send_result(msg["id"], labels)
+    return labels
@@ -4,15 +4,35 @@ import voluptuous as vol
 from homeassistant.core import HomeAssistant
 from homeassistant.components import websocket_api
 
+from .revisions import REVISION_USERS, get_revision_tracker, send_not_modified, send_revisioned_result
+from .set_auths import get_auth_revision
 
-@websocket_api.websocket_command({vol.Required("type"): "ha_access_control/list_users"})
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "ha_access_control/list_users",
+        vol.Optional("revision"): vol.Any(str, None),
+    }
+)
 @websocket_api.require_admin
 @websocket_api.async_response
 async def list_users(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
+    # Group memberships are edited through the auth store directly, so the
+    # ACM auth revision is part of the token alongside user add/update/remove.
+    revision = get_revision_tracker(hass).token(REVISION_USERS, extra=get_auth_revision(hass))
+    if send_not_modified(connection, msg, revision):
+        return
+
+    send_revisioned_result(
+        connection, msg, revision, build_user_rows(await hass.auth.async_get_users())
+    )
+
+
+def build_user_rows(users: list[Any]) -> list[dict[str, Any]]:
     result = []
-    for user in await hass.auth.async_get_users():
+    for user in users:
         if not user.is_active or user.system_generated:
             continue
 
@@ -33,4 +53,5 @@ async def list_users(
                 "group_ids": [group.id for group in user.groups],
             }
         )
-    connection.send_result(msg["id"], result)
+
+    return result
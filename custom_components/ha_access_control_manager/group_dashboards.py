@@ -0,0 +1,104 @@
+import asyncio
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .file_manager import get_json_file
+from .const import (
+    DATA_GROUP_DASHBOARDS,
+    DOMAIN,
+    GROUP_DASHBOARDS_SAVE_DELAY,
+    GROUP_DASHBOARDS_STORAGE_KEY,
+    GROUP_DASHBOARDS_STORAGE_VERSION,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class GroupDashboardPermissions:
+    """Dashboard and view permissions of every ACM group, kept in memory.
+
+    Loaded once, then read without touching disk; every change schedules a
+    delayed save so bursts of edits end up in a single write. The values of
+    ``groups`` are replaced, never mutated, so they can be handed out as is.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._store: Store = Store(hass, GROUP_DASHBOARDS_STORAGE_VERSION, GROUP_DASHBOARDS_STORAGE_KEY)
+        self._groups: dict[str, Any] = {}
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+
+    @property
+    def groups(self) -> dict[str, Any]:
+        """Dashboard permissions by group id; read-only."""
+        return self._groups
+
+    async def async_load(self) -> None:
+        if self._loaded:
+            return
+
+        async with self._load_lock:
+            if self._loaded:
+                return
+
+            try:
+                stored = await self._store.async_load()
+            except KeyError:
+                # No storage envelope: the file predates this store.
+                groups = await self._async_migrate_legacy_file()
+                if groups is None:
+                    raise
+            else:
+                groups = stored.get("groups") if isinstance(stored, dict) else None
+
+            self._groups = groups if isinstance(groups, dict) else {}
+            self._loaded = True
+
+    @callback
+    def async_set(self, group_id: str, dashboards: dict[str, Any]) -> None:
+        self._groups[group_id] = dashboards
+        self._schedule_save()
+
+    @callback
+    def async_rename(self, old_group_id: str, new_group_id: str) -> None:
+        if old_group_id == new_group_id or old_group_id not in self._groups:
+            return
+
+        self._groups[new_group_id] = self._groups.pop(old_group_id)
+        self._schedule_save()
+
+    @callback
+    def async_delete(self, group_id: str) -> None:
+        if self._groups.pop(group_id, None) is not None:
+            self._schedule_save()
+
+    async def _async_migrate_legacy_file(self) -> dict[str, Any] | None:
+        """Adopt a file written before this store existed: the same path, but a bare
+        ``{"groups": ...}`` without Home Assistant's storage envelope."""
+        legacy_data = await get_json_file(self._hass, self._store.path)
+        if not isinstance(legacy_data, dict) or "version" in legacy_data:
+            return None
+
+        groups = legacy_data.get("groups")
+        groups = groups if isinstance(groups, dict) else {}
+        await self._store.async_save({"groups": groups})
+        _LOGGER.info("Migrated %s group dashboard permissions to versioned storage", len(groups))
+        return groups
+
+    def _schedule_save(self) -> None:
+        self._store.async_delay_save(lambda: {"groups": self._groups}, GROUP_DASHBOARDS_SAVE_DELAY)
+
+
+async def async_get_group_dashboard_permissions(hass: HomeAssistant) -> GroupDashboardPermissions:
+    """The loaded permissions model; only the first call after setup reads the store."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    permissions = domain_data.get(DATA_GROUP_DASHBOARDS)
+    if permissions is None:
+        permissions = domain_data[DATA_GROUP_DASHBOARDS] = GroupDashboardPermissions(hass)
+
+    await permissions.async_load()
+    return permissions
@@ -0,0 +1,84 @@
+from collections.abc import Iterable
+import logging
+
+from homeassistant.const import EVENT_COMPONENT_LOADED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.loader import Integration, async_get_integrations
+from homeassistant.setup import ATTR_COMPONENT
+
+from .const import DATA_INTEGRATION_NAMES, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class IntegrationNameCache:
+    """Domain to human-readable integration name, shared for the lifetime of Home Assistant.
+
+    Names are resolved in one concurrent ``async_get_integrations`` call per
+    batch of unknown domains, so serializers can look them up synchronously.
+    Domains that could not be resolved fall back to the domain itself and are
+    retried when a component with that domain loads; ``version`` changes
+    whenever an already served name changes.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._names: dict[str, str] = {}
+        self._unresolved: set[str] = set()
+        self.version = 0
+
+        hass.bus.async_listen(EVENT_COMPONENT_LOADED, self._async_component_loaded)
+
+    def name(self, domain: str) -> str:
+        return self._names.get(domain, domain)
+
+    async def async_prewarm(self) -> None:
+        """Resolve the integration of every configured config entry."""
+        try:
+            await self.async_ensure(self.config_entry_domains())
+        except Exception:  # noqa: BLE001 - background task, names are resolved on demand
+            _LOGGER.exception("Error while prewarming integration names")
+
+    def config_entry_domains(self) -> set[str]:
+        return {entry.domain for entry in self._hass.config_entries.async_entries()}
+
+    async def async_ensure(self, domains: Iterable[str]) -> None:
+        missing = {domain for domain in domains if domain not in self._names}
+        if not missing:
+            return
+
+        integrations = await async_get_integrations(self._hass, missing)
+        for domain in missing:
+            integration = integrations.get(domain)
+            if isinstance(integration, Integration):
+                if domain in self._unresolved and integration.name != domain:
+                    self.version += 1
+                self._names[domain] = integration.name
+                self._unresolved.discard(domain)
+            else:
+                self._names[domain] = domain
+                self._unresolved.add(domain)
+
+    @callback
+    def _async_component_loaded(self, event: Event) -> None:
+        domain = str(event.data.get(ATTR_COMPONENT, "")).partition(".")[0]
+        if not domain or (domain in self._names and domain not in self._unresolved):
+            return
+
+        self._names.pop(domain, None)
+        self._hass.async_create_task(self._async_resolve_logged(domain))
+
+    async def _async_resolve_logged(self, domain: str) -> None:
+        try:
+            await self.async_ensure((domain,))
+        except Exception:  # noqa: BLE001 - background task, names fall back to the domain
+            _LOGGER.exception("Error while resolving the integration name of %s", domain)
+
+
+def get_integration_names(hass: HomeAssistant) -> IntegrationNameCache:
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    names = domain_data.get(DATA_INTEGRATION_NAMES)
+    if names is None:
+        names = domain_data[DATA_INTEGRATION_NAMES] = IntegrationNameCache(hass)
+
+    return names
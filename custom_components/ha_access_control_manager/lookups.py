@@ -0,0 +1,97 @@
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import area_registry as ar
+from homeassistant.helpers import device_registry as dr
+
+try:
+    from homeassistant.helpers import category_registry as cr
+except ImportError:  # pragma: no cover - older Home Assistant versions
+    cr = None
+
+try:
+    from homeassistant.helpers import label_registry as lr
+except ImportError:  # pragma: no cover - older Home Assistant versions
+    lr = None
+
+from .const import DATA_LOOKUPS, DOMAIN
+from .revisions import REVISION_LOOKUPS, get_revision_tracker
+
+HELPER_CATEGORY_SCOPE = "helpers"
+
+
+class RegistryLookups:
+    """Id to name tables for labels, areas, devices and helper categories.
+
+    Built once per lookup revision and shared by every listing, so serializing
+    a row never goes back to the registries.
+    """
+
+    __slots__ = ("label_names", "area_names", "device_names", "device_area_ids", "helper_category_names")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.label_names: dict[str, str] = (
+            {label.label_id: label.name for label in lr.async_get(hass).async_list_labels()}
+            if lr is not None
+            else {}
+        )
+        self.area_names: dict[str, str] = {
+            area.id: area.name for area in ar.async_get(hass).async_list_areas()
+        }
+
+        self.device_names: dict[str, str] = {}
+        self.device_area_ids: dict[str, str | None] = {}
+        for device in dr.async_get(hass).devices.values():
+            self.device_names[device.id] = getattr(device, "name_by_user", None) or device.name or device.id
+            self.device_area_ids[device.id] = device.area_id
+
+        self.helper_category_names: dict[str, str] = (
+            {
+                category.category_id: category.name
+                for category in cr.async_get(hass).async_list_categories(scope=HELPER_CATEGORY_SCOPE)
+            }
+            if cr is not None
+            else {}
+        )
+
+    def labels(self, label_ids) -> list[dict[str, str]]:
+        """Resolve label IDs to names while keeping the ID for filtering."""
+        return [
+            {"id": label_id, "name": self.label_names.get(label_id, label_id)}
+            for label_id in sorted(label_ids or [])
+        ]
+
+    def area_name(self, area_id: str | None) -> str | None:
+        if not area_id:
+            return None
+
+        return self.area_names.get(area_id)
+
+    def device_name(self, device_id: str | None) -> str | None:
+        if not device_id:
+            return None
+
+        return self.device_names.get(device_id)
+
+    def entity_area_name(self, area_id: str | None, device_id: str | None) -> str | None:
+        """Area of an entity, falling back to the area of its device."""
+        if not area_id and device_id:
+            area_id = self.device_area_ids.get(device_id)
+
+        return self.area_name(area_id)
+
+    def helper_category_name(self, category_id: str | None) -> str | None:
+        if not category_id:
+            return None
+
+        return self.helper_category_names.get(category_id)
+
+
+def get_registry_lookups(hass: HomeAssistant) -> RegistryLookups:
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    revision = get_revision_tracker(hass).token(REVISION_LOOKUPS)
+    cached: tuple[str, RegistryLookups] | None = domain_data.get(DATA_LOOKUPS)
+    if cached is not None and cached[0] == revision:
+        return cached[1]
+
+    lookups = RegistryLookups(hass)
+    domain_data[DATA_LOOKUPS] = (revision, lookups)
+    return lookups
@@ -0,0 +1,137 @@
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from .dashboard_cache import get_dashboard_cache
+from .view_index import get_view_index
+from .const import LOVELACE_DATA, LOVELACE_MODE_STORAGE, LOVELACE_STORAGE, LOVELACE_STORAGE_PREFIX
+
+
+class LoadedDashboard:
+    """A dashboard config together with the backend it must be written back to.
+
+    ``config`` is the live object: mutate it in place, then call ``async_save``.
+    Runtime-backed dashboards save through Home Assistant's Lovelace storage,
+    so its in-memory copy never diverges from what ACM wrote.
+    """
+
+    __slots__ = ("dashboard_id", "config", "_runtime", "_file_path", "_storage")
+
+    def __init__(
+        self,
+        dashboard_id: str,
+        config: dict[str, Any],
+        runtime: Any = None,
+        file_path: str | None = None,
+        storage: dict[str, Any] | None = None,
+    ) -> None:
+        self.dashboard_id = dashboard_id
+        self.config = config
+        self._runtime = runtime
+        self._file_path = file_path
+        self._storage = storage
+
+    @property
+    def is_runtime(self) -> bool:
+        return self._runtime is not None
+
+    async def async_save(self, hass: HomeAssistant) -> None:
+        if self._runtime is not None:
+            await self._runtime.async_save(self.config)
+            return
+
+        if self._file_path and self._storage is not None:
+            fingerprint = await get_dashboard_cache(hass).async_save(hass, self._file_path, self._storage)
+            if fingerprint is not None:
+                get_view_index(hass).async_update(self._file_path, fingerprint, self.config)
+
+
+def get_runtime_dashboards(hass: HomeAssistant) -> dict[str, Any]:
+    """Map ACM dashboard ids to the storage-mode Lovelace configs loaded by Home Assistant."""
+    lovelace_data = hass.data.get(LOVELACE_DATA)
+    dashboards = getattr(lovelace_data, "dashboards", None)
+    if dashboards is None and isinstance(lovelace_data, dict):
+        dashboards = lovelace_data.get("dashboards")
+
+    if not isinstance(dashboards, dict):
+        return {}
+
+    runtime_dashboards: dict[str, Any] = {}
+    for dashboard in dashboards.values():
+        if getattr(dashboard, "mode", None) != LOVELACE_MODE_STORAGE:
+            continue
+
+        dashboard_config = getattr(dashboard, "config", None)
+        if dashboard_config is None:
+            runtime_dashboards["lovelace"] = dashboard
+            continue
+
+        dashboard_id = dashboard_config.get("id") if isinstance(dashboard_config, dict) else None
+        if isinstance(dashboard_id, str) and dashboard_id:
+            runtime_dashboards[dashboard_id] = dashboard
+
+    return runtime_dashboards
+
+
+async def async_load_dashboard(
+    hass: HomeAssistant,
+    dashboard_id: str,
+    filename: str,
+    runtime_dashboards: dict[str, Any] | None = None,
+    may_exist: Callable[[str], bool] | None = None,
+) -> LoadedDashboard | None:
+    """Load a dashboard from the live Lovelace runtime, falling back to its storage file.
+
+    ``may_exist`` lets the caller rule out storage candidates it knows are missing.
+    """
+    if runtime_dashboards is None:
+        runtime_dashboards = get_runtime_dashboards(hass)
+
+    runtime = runtime_dashboards.get(dashboard_id)
+    if runtime is not None:
+        config = await async_load_runtime_config(runtime)
+        if config is not None:
+            return LoadedDashboard(dashboard_id, config, runtime=runtime)
+
+    dashboard_cache = get_dashboard_cache(hass)
+    for candidate in storage_candidates(dashboard_id, filename):
+        if may_exist is not None and not may_exist(candidate):
+            continue
+
+        file_path = hass.config.path(candidate)
+        storage = await dashboard_cache.async_get(hass, file_path)
+        if not isinstance(storage, dict):
+            continue
+
+        data = storage.get("data")
+        config = data.get("config") if isinstance(data, dict) else None
+        if not isinstance(config, dict):
+            continue
+
+        return LoadedDashboard(dashboard_id, config, file_path=file_path, storage=storage)
+
+    return None
+
+
+async def async_load_runtime_config(runtime: Any) -> dict[str, Any] | None:
+    try:
+        config = await runtime.async_load(False)
+    except HomeAssistantError:
+        return None
+
+    return config if isinstance(config, dict) else None
+
+
+def storage_candidates(dashboard_id: str, filename: str) -> list[str]:
+    """Storage files that may hold a dashboard, in lookup order."""
+    candidates = [filename]
+    if dashboard_id == "lovelace":
+        fallback_filename = f"{LOVELACE_STORAGE_PREFIX}lovelace"
+        if filename == LOVELACE_STORAGE:
+            candidates = [fallback_filename, filename]
+        elif fallback_filename not in candidates:
+            candidates.append(fallback_filename)
+
+    return candidates
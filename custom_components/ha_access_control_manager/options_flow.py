@@ -1,7 +1,7 @@
 import voluptuous as vol
 from homeassistant import config_entries
 
-from .const import ICONS 
+from .const import DEFAULT_SYNC_DELAY, ICONS
 
 class OptionsFlowHandler(config_entries.OptionsFlow):
     """Handle options flow for Access Control Manager."""
@@ -21,11 +21,15 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         tab_icon = self.config_entry.options.get("tab_icon", self.config_entry.data.get("tab_icon", "mdi:shield-account"))
         tab_name = self.config_entry.options.get("tab_name", self.config_entry.data.get("tab_name", "Access Control Manager"))
         path = self.config_entry.options.get("path", self.config_entry.data.get("path", "/ha-access-control-manager"))
+        sync_delay = self.config_entry.options.get("sync_delay", DEFAULT_SYNC_DELAY)
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema({
                 vol.Optional("tab_icon", default=tab_icon): vol.In(ICONS),
                 vol.Optional("tab_name", default=tab_name): str,
                 vol.Optional("path", default=path): str,
+                vol.Optional("sync_delay", default=sync_delay): vol.All(
+                    vol.Coerce(float), vol.Range(min=0, max=60)
+                ),
             }),
         )
\ No newline at end of file
@@ -0,0 +1,101 @@
+from typing import Any
+
+from .const import SYSTEM_GROUPS_WITH_FULL_DASHBOARD_ACCESS
+
+
+class _DashboardPermissions:
+    """Group visibility for one dashboard, expressed as user bitmasks."""
+
+    __slots__ = ("default_masks", "default_mask", "view_overrides")
+
+    def __init__(self) -> None:
+        self.default_masks: dict[str, int] = {}
+        self.default_mask = 0
+        self.view_overrides: dict[str, list[tuple[str, int, bool]]] = {}
+
+
+class ViewPermissionIndex:
+    """Inverted index resolving the users allowed to see a dashboard view.
+
+    Every active user gets a bit; each group is reduced to the bitmask of its
+    members, and each dashboard to the masks of the groups that can see it by
+    default plus per-view overrides. Resolving a view is then a handful of
+    bitwise ORs instead of a walk over every user and every group.
+    """
+
+    def __init__(
+        self,
+        user_group_ids: dict[str, list[str]],
+        dashboards_map: dict[str, Any],
+    ) -> None:
+        self._user_ids = list(user_group_ids)
+        self._full_access_mask = 0
+        self._dashboards: dict[str, _DashboardPermissions] = {}
+        self._user_ids_by_mask: dict[int, list[str]] = {}
+
+        group_masks: dict[str, int] = {}
+        for bit, group_ids in enumerate(user_group_ids.values()):
+            user_bit = 1 << bit
+            for group_id in set(group_ids):
+                if group_id in SYSTEM_GROUPS_WITH_FULL_DASHBOARD_ACCESS:
+                    self._full_access_mask |= user_bit
+                group_masks[group_id] = group_masks.get(group_id, 0) | user_bit
+
+        for group_id, group_mask in group_masks.items():
+            group_dashboards = dashboards_map.get(group_id) if isinstance(dashboards_map, dict) else None
+            if not isinstance(group_dashboards, dict):
+                continue
+
+            for dashboard_id, dashboard_state in group_dashboards.items():
+                if not isinstance(dashboard_state, dict):
+                    continue
+
+                permissions = self._dashboards.get(dashboard_id)
+                if permissions is None:
+                    permissions = self._dashboards[dashboard_id] = _DashboardPermissions()
+
+                if dashboard_state.get("visible") is True:
+                    permissions.default_masks[group_id] = group_mask
+                    permissions.default_mask |= group_mask
+
+                view_states = dashboard_state.get("views")
+                if not isinstance(view_states, dict):
+                    continue
+
+                for view_id, view_visible in view_states.items():
+                    permissions.view_overrides.setdefault(view_id, []).append(
+                        (group_id, group_mask, view_visible is True)
+                    )
+
+    def allowed_user_ids(self, dashboard_id: str, view_id: str) -> list[str]:
+        """Return allowed user ids for a view, in user registration order."""
+        mask = self._full_access_mask
+        permissions = self._dashboards.get(dashboard_id)
+
+        if permissions is not None:
+            overrides = permissions.view_overrides.get(view_id)
+            if not overrides:
+                mask |= permissions.default_mask
+            else:
+                overridden_group_ids = {group_id for group_id, _, _ in overrides}
+                for group_id, group_mask in permissions.default_masks.items():
+                    if group_id not in overridden_group_ids:
+                        mask |= group_mask
+
+                for _, group_mask, view_visible in overrides:
+                    if view_visible:
+                        mask |= group_mask
+
+        return list(self._user_ids_for_mask(mask))
+
+    def _user_ids_for_mask(self, mask: int) -> list[str]:
+        user_ids = self._user_ids_by_mask.get(mask)
+        if user_ids is None:
+            user_ids = [
+                user_id
+                for bit, user_id in enumerate(self._user_ids)
+                if mask >> bit & 1
+            ]
+            self._user_ids_by_mask[mask] = user_ids
+
+        return user_ids
@@ -0,0 +1,81 @@
+from typing import Any
+
+import voluptuous as vol
+
+PROFILE_FULL = "full"
+PROFILE_PANEL = "panel"
+
+# Columns the admin panel actually reads, per listing.
+PANEL_DEVICE_FIELDS = frozenset(
+    {"id", "name", "integration", "integrations", "area", "disabled_by", "labels", "entities"}
+)
+PANEL_ENTITY_FIELDS = frozenset(
+    {
+        "entity_id", "name", "original_name", "domain", "platform", "device_id",
+        "area", "disabled_by", "hidden_by", "labels",
+    }
+)
+PANEL_HELPER_FIELDS = frozenset(
+    {
+        "entity_id", "name", "helper_type", "area", "device_id", "device_name",
+        "disabled_by", "hidden_by", "labels", "category_id", "category_name", "voice_assistants",
+    }
+)
+
+PROJECTION_SCHEMA = {
+    vol.Optional("profile"): vol.In([PROFILE_FULL, PROFILE_PANEL]),
+    vol.Optional("fields"): [str],
+    vol.Optional("entity_fields"): [str],
+}
+
+
+class Projection:
+    """Field sets requested for a listing; ``None`` keeps every field."""
+
+    __slots__ = ("fields", "entity_fields")
+
+    def __init__(self, fields: frozenset[str] | None, entity_fields: frozenset[str] | None = None) -> None:
+        self.fields = fields
+        self.entity_fields = entity_fields
+
+    @property
+    def key(self) -> str | None:
+        """Stable identifier, mixed into revisions and cache keys; ``None`` for full payloads."""
+        if self.fields is None and self.entity_fields is None:
+            return None
+
+        return "|".join(
+            ",".join(sorted(field_set)) if field_set is not None else "*"
+            for field_set in (self.fields, self.entity_fields)
+        )
+
+    def wants(self, field: str) -> bool:
+        return self.fields is None or field in self.fields
+
+
+def resolve_projection(
+    msg: dict[str, Any],
+    panel_fields: frozenset[str],
+    panel_entity_fields: frozenset[str] | None = None,
+) -> Projection:
+    """Build the projection for a request: explicit ``fields`` win over ``profile``."""
+    fields: frozenset[str] | None = None
+    entity_fields: frozenset[str] | None = None
+
+    if msg.get("profile") == PROFILE_PANEL:
+        fields = panel_fields
+        entity_fields = panel_entity_fields
+
+    if "fields" in msg:
+        fields = frozenset(msg["fields"])
+    if "entity_fields" in msg and panel_entity_fields is not None:
+        entity_fields = frozenset(msg["entity_fields"])
+
+    return Projection(fields, entity_fields)
+
+
+def project(item: dict[str, Any], fields: frozenset[str] | None) -> dict[str, Any]:
+    if fields is None:
+        return item
+
+    return {key: value for key, value in item.items() if key in fields}
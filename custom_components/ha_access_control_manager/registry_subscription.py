@@ -0,0 +1,433 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+import logging
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import area_registry as ar
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_call_later
+
+try:
+    from homeassistant.helpers import category_registry as cr
+except ImportError:  # pragma: no cover - older Home Assistant versions
+    cr = None
+
+try:
+    from homeassistant.helpers import label_registry as lr
+except ImportError:  # pragma: no cover - older Home Assistant versions
+    lr = None
+
+from .columnar import FORMAT_SCHEMA, encode_rows, wants_columnar
+from .const import DATA_REGISTRY_PUBLISHER, DOMAIN, REGISTRY_DIFF_DELAY, STREAM_CHUNK_SIZE
+from .get_devices import encode_device_tree, get_device_snapshot, iter_device_tree, project_device
+from .get_helpers import HELPER_COLUMN_ENCODINGS, _iter_helpers
+from .get_labels import build_label_rows
+from .projection import (
+    PANEL_DEVICE_FIELDS,
+    PANEL_ENTITY_FIELDS,
+    PANEL_HELPER_FIELDS,
+    PROFILE_FULL,
+    PROFILE_PANEL,
+    Projection,
+    project,
+    resolve_projection,
+)
+from .revisions import (
+    REVISION_DEVICES,
+    REVISION_HELPERS,
+    REVISION_LABELS,
+    get_revision_tracker,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+SECTION_DEVICES = "devices"
+SECTION_ENTITIES = "entities"
+SECTION_HELPERS = "helpers"
+SECTION_LABELS = "labels"
+
+
+class _Subscriber:
+    __slots__ = ("connection", "msg_id", "device_projection", "helper_projection", "columnar")
+
+    def __init__(
+        self,
+        connection: websocket_api.ActiveConnection,
+        msg_id: int,
+        device_projection: Projection,
+        helper_projection: Projection,
+        columnar: bool = False,
+    ) -> None:
+        self.connection = connection
+        self.msg_id = msg_id
+        self.device_projection = device_projection
+        self.helper_projection = helper_projection
+        self.columnar = columnar
+
+    def send(self, payload: dict[str, Any]) -> None:
+        self.connection.send_message(websocket_api.event_message(self.msg_id, payload))
+
+
+class RegistryDiffPublisher:
+    """Push device, entity, helper and label changes to subscribed panels.
+
+    Registry events only flag the sections they touch; after ``REGISTRY_DIFF_DELAY``
+    the flagged sections are recomputed once and compared with what
+    subscribers last received, and only changed or removed rows are sent.
+    Device and entity rows come from the device snapshot, whose untouched
+    entries keep their identity, so that comparison is a pointer check.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._lock = asyncio.Lock()
+        self._subscribers: set[_Subscriber] = set()
+        self._pending: set[_Subscriber] = set()
+        self._unsub_listeners: list[Callable[[], None]] = []
+        self._unsub_timer: Callable[[], None] | None = None
+        self._dirty_sections: set[str] = set()
+        self._devices: dict[str, dict[str, Any]] = {}
+        self._entities: dict[str, dict[str, Any]] = {}
+        self._helpers: dict[str, dict[str, Any]] = {}
+        self._labels: dict[str, dict[str, Any]] = {}
+
+    async def async_subscribe(self, subscriber: _Subscriber, revisions: dict[str, Any]) -> None:
+        """Send the initial sections to ``subscriber``, then start pushing diffs to it."""
+        async with self._lock:
+            # Pending until its snapshot is sent: it keeps the listeners alive if
+            # another subscriber leaves meanwhile, but receives no diffs yet.
+            self._pending.add(subscriber)
+            try:
+                # Revisions are read before the baseline is brought up to date, so a
+                # section is tagged with a revision no newer than its content.
+                revisions_before = self._section_revisions(subscriber)
+                if not self._unsub_listeners:
+                    self._start_listening()
+                    await self._async_load_baseline()
+                else:
+                    await self._async_flush_locked()
+
+                revisions_after = self._section_revisions(subscriber)
+                unchanged = {
+                    section
+                    for section, revision in revisions_before.items()
+                    if revisions.get(section) == revision == revisions_after[section]
+                }
+                await self._async_send_snapshot(subscriber, revisions_before, unchanged)
+            except BaseException:
+                self.async_unsubscribe(subscriber)
+                raise
+
+            self._pending.discard(subscriber)
+            self._subscribers.add(subscriber)
+
+    @callback
+    def async_unsubscribe(self, subscriber: _Subscriber) -> None:
+        self._subscribers.discard(subscriber)
+        self._pending.discard(subscriber)
+        if self._subscribers or self._pending:
+            return
+
+        for unsub in self._unsub_listeners:
+            unsub()
+        self._unsub_listeners = []
+        self._cancel_timer()
+        self._dirty_sections.clear()
+
+    def _start_listening(self) -> None:
+        sections_by_event = {
+            dr.EVENT_DEVICE_REGISTRY_UPDATED: (SECTION_DEVICES, SECTION_HELPERS),
+            er.EVENT_ENTITY_REGISTRY_UPDATED: (SECTION_DEVICES, SECTION_HELPERS),
+            ar.EVENT_AREA_REGISTRY_UPDATED: (SECTION_DEVICES, SECTION_HELPERS),
+        }
+        if lr is not None:
+            sections_by_event[lr.EVENT_LABEL_REGISTRY_UPDATED] = (
+                SECTION_DEVICES, SECTION_HELPERS, SECTION_LABELS,
+            )
+        if cr is not None:
+            sections_by_event[cr.EVENT_CATEGORY_REGISTRY_UPDATED] = (SECTION_HELPERS,)
+
+        for event_type, sections in sections_by_event.items():
+            self._unsub_listeners.append(
+                self._hass.bus.async_listen(event_type, self._make_listener(sections))
+            )
+
+    def _make_listener(self, sections: tuple[str, ...]):
+        @callback
+        def _async_listener(_event: Event) -> None:
+            self._dirty_sections.update(sections)
+            if self._unsub_timer is None:
+                self._unsub_timer = async_call_later(
+                    self._hass, REGISTRY_DIFF_DELAY, self._async_timer_fired
+                )
+
+        return _async_listener
+
+    @callback
+    def _async_timer_fired(self, _now: Any) -> None:
+        self._unsub_timer = None
+        self._hass.async_create_task(self._async_flush())
+
+    @callback
+    def _cancel_timer(self) -> None:
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    async def _async_load_baseline(self) -> None:
+        self._dirty_sections.clear()
+        self._devices, self._entities = await get_device_snapshot(self._hass).async_entries()
+        self._helpers = {helper["entity_id"]: helper for helper in _iter_helpers(self._hass, Projection(None))}
+        self._labels = {label["id"]: label for label in build_label_rows(self._hass)}
+
+    async def _async_flush(self) -> None:
+        try:
+            async with self._lock:
+                await self._async_flush_locked()
+        except Exception:  # noqa: BLE001 - background task, keep the publisher alive
+            _LOGGER.exception("Error while publishing registry changes")
+
+    async def _async_flush_locked(self) -> None:
+        self._cancel_timer()
+        sections = self._dirty_sections
+        self._dirty_sections = set()
+        if not sections:
+            return
+
+        diff: dict[str, dict[str, Any]] = {}
+
+        if SECTION_DEVICES in sections:
+            devices, entities = await get_device_snapshot(self._hass).async_entries()
+            _add_diff(diff, SECTION_DEVICES, _diff_by_identity(self._devices, devices))
+            _add_diff(diff, SECTION_ENTITIES, _diff_by_identity(self._entities, entities))
+            self._devices, self._entities = devices, entities
+
+        if SECTION_HELPERS in sections:
+            helpers = {helper["entity_id"]: helper for helper in _iter_helpers(self._hass, Projection(None))}
+            _add_diff(diff, SECTION_HELPERS, _diff_by_value(self._helpers, helpers))
+            self._helpers = helpers
+
+        if SECTION_LABELS in sections:
+            labels = {label["id"]: label for label in build_label_rows(self._hass)}
+            _add_diff(diff, SECTION_LABELS, _diff_by_value(self._labels, labels))
+            self._labels = labels
+
+        if not diff:
+            return
+
+        for subscriber in list(self._subscribers):
+            subscriber.send({"diff": _project_diff(diff, subscriber)})
+
+    def _section_revisions(self, subscriber: _Subscriber) -> dict[str, str]:
+        tracker = get_revision_tracker(self._hass)
+        return {
+            SECTION_DEVICES: tracker.token(REVISION_DEVICES, extra=subscriber.device_projection.key),
+            SECTION_HELPERS: tracker.token(REVISION_HELPERS, extra=subscriber.helper_projection.key),
+            SECTION_LABELS: tracker.token(REVISION_LABELS),
+        }
+
+    async def _async_send_snapshot(
+        self,
+        subscriber: _Subscriber,
+        revisions: dict[str, str],
+        unchanged: set[str],
+    ) -> None:
+        # Rows are projected as each chunk is filled, so only one projected chunk
+        # is alive at a time next to the baseline the diffs are computed from. The
+        # baseline is only replaced under the lock held here.
+        sections = {
+            SECTION_DEVICES: lambda: (
+                project_device(device, subscriber.device_projection)
+                for device in iter_device_tree(self._devices, self._entities)
+            ),
+            SECTION_HELPERS: lambda: (
+                project(helper, subscriber.helper_projection.fields) for helper in self._helpers.values()
+            ),
+            SECTION_LABELS: lambda: iter(self._labels.values()),
+        }
+
+        encoders = {
+            SECTION_DEVICES: encode_device_tree,
+            SECTION_HELPERS: lambda chunk: encode_rows(chunk, HELPER_COLUMN_ENCODINGS),
+        }
+
+        for section, build_items in sections.items():
+            if section in unchanged:
+                subscriber.send({"section": section, "revision": revisions[section], "not_modified": True})
+                continue
+
+            await _async_send_section(
+                subscriber,
+                section,
+                revisions[section],
+                build_items(),
+                weight=_device_weight if section == SECTION_DEVICES else None,
+                encode=encoders.get(section) if subscriber.columnar else None,
+            )
+
+        subscriber.send({"ready": True})
+
+
+def _device_weight(device: dict[str, Any]) -> int:
+    return 1 + len(device.get("entities", ()))
+
+
+async def _async_send_section(
+    subscriber: _Subscriber,
+    section: str,
+    revision: str,
+    items: Iterable[dict[str, Any]],
+    weight: Callable[[dict[str, Any]], int] | None = None,
+    encode: Callable[[list[dict[str, Any]]], dict[str, Any]] | None = None,
+) -> None:
+    def _send_chunk(chunk: list[dict[str, Any]]) -> None:
+        if encode is None:
+            subscriber.send({"section": section, "items": chunk})
+        else:
+            subscriber.send({"section": section, "columnar": encode(chunk)})
+
+    chunk: list[dict[str, Any]] = []
+    chunk_weight = 0
+    for item in items:
+        chunk.append(item)
+        chunk_weight += weight(item) if weight else 1
+        if chunk_weight >= STREAM_CHUNK_SIZE:
+            _send_chunk(chunk)
+            chunk = []
+            chunk_weight = 0
+            await asyncio.sleep(0)
+
+    if chunk:
+        _send_chunk(chunk)
+
+    subscriber.send({"section": section, "revision": revision, "done": True})
+
+
+def _diff_by_identity(
+    previous: dict[str, dict[str, Any]], current: dict[str, dict[str, Any]]
+) -> tuple[list[dict[str, Any]], list[str]]:
+    updated = [item for key, item in current.items() if previous.get(key) is not item]
+    removed = [key for key in previous if key not in current]
+    return updated, removed
+
+
+def _diff_by_value(
+    previous: dict[str, dict[str, Any]], current: dict[str, dict[str, Any]]
+) -> tuple[list[dict[str, Any]], list[str]]:
+    updated = [item for key, item in current.items() if previous.get(key) != item]
+    removed = [key for key in previous if key not in current]
+    return updated, removed
+
+
+def _add_diff(
+    diff: dict[str, dict[str, Any]],
+    section: str,
+    changes: tuple[list[dict[str, Any]], list[str]],
+) -> None:
+    updated, removed = changes
+    if updated or removed:
+        diff[section] = {"updated": updated, "removed": removed}
+
+
+def _project_diff(diff: dict[str, dict[str, Any]], subscriber: _Subscriber) -> dict[str, Any]:
+    field_sets = {
+        SECTION_DEVICES: subscriber.device_projection.fields,
+        SECTION_ENTITIES: subscriber.device_projection.entity_fields,
+        SECTION_HELPERS: subscriber.helper_projection.fields,
+        SECTION_LABELS: None,
+    }
+
+    projected: dict[str, Any] = {}
+    for section, changes in diff.items():
+        fields = field_sets[section]
+        updated = changes["updated"]
+        if section == SECTION_DEVICES:
+            # Device rows travel without their entities; those have their own section.
+            updated = [
+                {key: value for key, value in item.items() if key != "entities"}
+                for item in updated
+            ]
+        projected[section] = {
+            "updated": [project(item, fields) for item in updated],
+            "removed": changes["removed"],
+        }
+
+    return projected
+
+
+def get_registry_publisher(hass: HomeAssistant) -> RegistryDiffPublisher:
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    publisher = domain_data.get(DATA_REGISTRY_PUBLISHER)
+    if publisher is None:
+        publisher = domain_data[DATA_REGISTRY_PUBLISHER] = RegistryDiffPublisher(hass)
+
+    return publisher
+
+
+SUBSCRIBE_SCHEMA = {
+    vol.Optional("profile"): vol.In([PROFILE_FULL, PROFILE_PANEL]),
+    vol.Optional("revisions", default={}): {str: vol.Any(str, None)},
+    **FORMAT_SCHEMA,
+}
+
+
+@callback
+def async_start_subscription(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+    send_first: Callable[[Callable[[dict[str, Any]], None]], Awaitable[None]] | None = None,
+) -> None:
+    """Subscribe a connection to registry diffs, after ``send_first`` sent any extra sections.
+
+    When building the initial sections fails, the subscriber gets an
+    ``{"error": ...}`` event instead of ``ready`` and no diffs.
+    """
+    publisher = get_registry_publisher(hass)
+    subscriber = _Subscriber(
+        connection,
+        msg["id"],
+        resolve_projection(msg, PANEL_DEVICE_FIELDS, PANEL_ENTITY_FIELDS),
+        resolve_projection(msg, PANEL_HELPER_FIELDS),
+        wants_columnar(msg),
+    )
+
+    async def _async_subscribe() -> None:
+        try:
+            if send_first is not None:
+                await send_first(subscriber.send)
+            await publisher.async_subscribe(subscriber, msg["revisions"])
+        except Exception as err:  # noqa: BLE001 - report the failure to the subscriber
+            _LOGGER.exception("Error while sending the initial %s sections", msg["type"])
+            subscriber.send({"error": str(err)})
+
+    task = hass.async_create_background_task(
+        _async_subscribe(), f"ha_access_control {msg['type']}"
+    )
+
+    @callback
+    def _async_unsubscribe() -> None:
+        task.cancel()
+        publisher.async_unsubscribe(subscriber)
+
+    connection.subscriptions[msg["id"]] = _async_unsubscribe
+    connection.send_result(msg["id"])
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "ha_access_control/subscribe_registries",
+        **SUBSCRIBE_SCHEMA,
+    }
+)
+@websocket_api.require_admin
+@callback
+def subscribe_registries(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    async_start_subscription(hass, connection, msg)
@@ -0,0 +1,129 @@
+import hashlib
+from typing import Any
+import uuid
+
+from homeassistant.auth import EVENT_USER_ADDED, EVENT_USER_REMOVED, EVENT_USER_UPDATED
+from homeassistant.components import websocket_api
+from homeassistant.const import EVENT_COMPONENT_LOADED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import area_registry as ar
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.json import json_bytes
+
+try:
+    from homeassistant.helpers import category_registry as cr
+except ImportError:  # pragma: no cover - older Home Assistant versions
+    cr = None
+
+try:
+    from homeassistant.helpers import label_registry as lr
+except ImportError:  # pragma: no cover - older Home Assistant versions
+    lr = None
+
+from .const import DATA_REVISIONS, DOMAIN
+
+REVISION_DEVICES = "devices"
+REVISION_HELPERS = "helpers"
+REVISION_LABELS = "labels"
+# Label, area, device and category names, see lookups.py.
+REVISION_LOOKUPS = "lookups"
+REVISION_USERS = "users"
+
+
+def _revision_sources() -> dict[str, tuple[str, ...]]:
+    sources = {
+        dr.EVENT_DEVICE_REGISTRY_UPDATED: (REVISION_DEVICES, REVISION_HELPERS, REVISION_LOOKUPS),
+        er.EVENT_ENTITY_REGISTRY_UPDATED: (REVISION_DEVICES, REVISION_HELPERS),
+        ar.EVENT_AREA_REGISTRY_UPDATED: (REVISION_DEVICES, REVISION_HELPERS, REVISION_LOOKUPS),
+        EVENT_COMPONENT_LOADED: (REVISION_DEVICES,),
+        EVENT_USER_ADDED: (REVISION_USERS,),
+        EVENT_USER_UPDATED: (REVISION_USERS,),
+        EVENT_USER_REMOVED: (REVISION_USERS,),
+    }
+    if lr is not None:
+        sources[lr.EVENT_LABEL_REGISTRY_UPDATED] = (
+            REVISION_DEVICES, REVISION_HELPERS, REVISION_LABELS, REVISION_LOOKUPS,
+        )
+    if cr is not None:
+        sources[cr.EVENT_CATEGORY_REGISTRY_UPDATED] = (REVISION_HELPERS, REVISION_LOOKUPS)
+
+    return sources
+
+
+class RevisionTracker:
+    """Per-listing change counters bumped by Home Assistant registry and user events.
+
+    Tokens embed a per-start instance id so a client revision obtained before a
+    restart can never match a counter that restarted from zero.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._instance_id = uuid.uuid4().hex[:8]
+        self._counters: dict[str, int] = {}
+
+        for event_type, names in _revision_sources().items():
+            hass.bus.async_listen(event_type, self._make_listener(names))
+
+    def token(self, *names: str, extra: Any = None) -> str:
+        parts = [self._instance_id, *(str(self._counters.get(name, 0)) for name in names)]
+        if extra is not None:
+            parts.append(str(extra))
+
+        return ":".join(parts)
+
+    @callback
+    def bump(self, *names: str) -> None:
+        for name in names:
+            self._counters[name] = self._counters.get(name, 0) + 1
+
+    def _make_listener(self, names: tuple[str, ...]):
+        @callback
+        def _async_listener(_event: Event) -> None:
+            self.bump(*names)
+
+        return _async_listener
+
+
+def get_revision_tracker(hass: HomeAssistant) -> RevisionTracker:
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    tracker = domain_data.get(DATA_REVISIONS)
+    if tracker is None:
+        tracker = domain_data[DATA_REVISIONS] = RevisionTracker(hass)
+
+    return tracker
+
+
+def content_revision(payload: Any) -> str:
+    """Return a short content hash for payloads that have no event-driven revision."""
+    return hashlib.sha1(json_bytes(payload)).hexdigest()[:16]
+
+
+def wants_revision(msg: dict[str, Any]) -> bool:
+    return "revision" in msg
+
+
+def send_not_modified(
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+    revision: str,
+) -> bool:
+    """Reply ``not_modified`` and return True when the client already holds ``revision``."""
+    if not wants_revision(msg) or msg.get("revision") != revision:
+        return False
+
+    connection.send_result(msg["id"], {"revision": revision, "not_modified": True})
+    return True
+
+
+def send_revisioned_result(
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+    revision: str,
+    payload: Any,
+) -> None:
+    """Send ``payload``, wrapped with its revision when the client asked for conditional fetch."""
+    if wants_revision(msg):
+        payload = {"revision": revision, "not_modified": False, "data": payload}
+
+    connection.send_result(msg["id"], payload)
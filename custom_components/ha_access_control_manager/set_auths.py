@@ -7,23 +7,27 @@ import unicodedata
 import voluptuous as vol
 
 from homeassistant.auth import models as auth_models
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.components import websocket_api
 
-from .file_manager import get_json_file, save_json_file
+from .file_manager import gather_with_concurrency, get_json_file
+from .dashboard_repository import DashboardRepository, get_dashboard_repository
+from .group_dashboards import async_get_group_dashboard_permissions
+from .lovelace_backend import get_runtime_dashboards
+from .permission_index import ViewPermissionIndex
+from .sync_scheduler import DashboardSyncScheduler
 from .const import (
     AUTH_PATH,
+    AUTH_SAVE_DELAY,
+    DASHBOARD_IO_CONCURRENCY,
+    DATA_AUTH_REVISION,
+    DATA_SYNC_SCHEDULER,
+    DOMAIN,
     NEW_AUTH_PATH,
-    GROUP_DASHBOARD_PERMISSIONS_PATH,
-    LOVELACE_DASHBOARDS_PATH,
-    LOVELACE_STORAGE_DIR,
-    LOVELACE_STORAGE,
-    LOVELACE_STORAGE_PREFIX,
     SYSTEM_GROUP_IDS,
+    SYSTEM_GROUPS_WITH_FULL_DASHBOARD_ACCESS,
 )
 
-SYSTEM_GROUPS_WITH_FULL_DASHBOARD_ACCESS = {"system-admin", "system-users"}
-
 
 def _build_default_group_policy() -> dict[str, Any]:
     return {"entities": {"entity_ids": {}}}
@@ -37,42 +41,67 @@ def _get_auth_store(hass: HomeAssistant) -> Any:
     return auth_store
 
 
-async def _persist_auth_store(hass: HomeAssistant) -> None:
+@callback
+def _schedule_auth_store_save(hass: HomeAssistant) -> None:
+    """Ask the auth store for a delayed save; bursts coalesce and pending data is flushed on stop."""
     auth_store = _get_auth_store(hass)
-    await auth_store._store.async_save(auth_store._data_to_save())
+    auth_store._store.async_delay_save(auth_store._data_to_save, AUTH_SAVE_DELAY)
 
 
-async def serialize_runtime_auth_data(hass: HomeAssistant) -> dict[str, Any]:
-    auth_store = _get_auth_store(hass)
+def get_sync_scheduler(hass: HomeAssistant) -> DashboardSyncScheduler:
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    scheduler = domain_data.get(DATA_SYNC_SCHEDULER)
+    if scheduler is None:
+        scheduler = DashboardSyncScheduler(hass, _sync_group_dashboards_to_users)
+        domain_data[DATA_SYNC_SCHEDULER] = scheduler
 
-    groups = []
-    for group in auth_store._groups.values():
-        group_data = {
-            "id": group.id,
-            "name": group.name,
-            "system_generated": group.system_generated,
-        }
-        if not group.system_generated:
-            group_data["policy"] = copy.deepcopy(group.policy)
-        groups.append(group_data)
+    return scheduler
 
-    users = []
-    for user in await hass.auth.async_get_users():
-        users.append(
-            {
-                "id": user.id,
-                "name": user.name,
-                "group_ids": _normalize_group_ids([group.id for group in user.groups]),
-                "is_owner": user.is_owner,
-                "is_active": user.is_active,
-                "system_generated": user.system_generated,
-                "local_only": getattr(user, "local_only", False),
-            }
-        )
+
+def get_auth_revision(hass: HomeAssistant) -> int:
+    return hass.data.get(DOMAIN, {}).get(DATA_AUTH_REVISION, 0)
+
+
+def _bump_auth_revision(hass: HomeAssistant) -> int:
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    revision = domain_data.get(DATA_AUTH_REVISION, 0) + 1
+    domain_data[DATA_AUTH_REVISION] = revision
+    return revision
+
+
+def _serialize_group(group: Any) -> dict[str, Any]:
+    group_data = {
+        "id": group.id,
+        "name": group.name,
+        "system_generated": group.system_generated,
+    }
+    if not group.system_generated:
+        group_data["policy"] = copy.deepcopy(group.policy)
+
+    return group_data
+
+
+def _serialize_user(user: Any) -> dict[str, Any]:
+    return {
+        "id": user.id,
+        "name": user.name,
+        "group_ids": _normalize_group_ids([group.id for group in user.groups]),
+        "is_owner": user.is_owner,
+        "is_active": user.is_active,
+        "system_generated": user.system_generated,
+        "local_only": getattr(user, "local_only", False),
+    }
+
+
+async def serialize_runtime_auth_data(hass: HomeAssistant, users: list[Any] | None = None) -> dict[str, Any]:
+    auth_store = _get_auth_store(hass)
+    if users is None:
+        users = await hass.auth.async_get_users()
 
     return {
-        "groups": groups,
-        "users": users,
+        "groups": [_serialize_group(group) for group in auth_store._groups.values()],
+        "users": [_serialize_user(user) for user in users],
+        "revision": get_auth_revision(hass),
     }
 
 
@@ -82,6 +111,51 @@ async def _build_auth_response_data(hass: HomeAssistant) -> dict[str, Any]:
     return auth_data
 
 
+async def _build_auth_delta(
+    hass: HomeAssistant,
+    group_ids: Any = (),
+    user_ids: Any = (),
+    removed_group_ids: Any = (),
+) -> dict[str, Any]:
+    """Serialize only the groups and users a mutation changed.
+
+    The auth revision is bumped only when the delta is not empty, so no-op
+    mutations keep the clients' cached auth snapshots valid.
+    """
+    auth_store = _get_auth_store(hass)
+    group_ids = list(dict.fromkeys(group_ids))
+    user_ids = list(dict.fromkeys(user_ids))
+    removed_group_ids = list(dict.fromkeys(removed_group_ids))
+    users = [await hass.auth.async_get_user(user_id) for user_id in user_ids]
+    changed = bool(group_ids or user_ids or removed_group_ids)
+
+    delta = {
+        "revision": _bump_auth_revision(hass) if changed else get_auth_revision(hass),
+        "groups": [
+            _serialize_group(auth_store._groups[group_id])
+            for group_id in group_ids
+            if group_id in auth_store._groups
+        ],
+        "users": [_serialize_user(user) for user in users if user is not None],
+        "removed_group_ids": removed_group_ids,
+    }
+    await _attach_group_dashboards(hass, delta)
+    return delta
+
+
+async def _build_mutation_response(
+    hass: HomeAssistant,
+    msg: dict[str, Any],
+    delta: dict[str, Any],
+    **extra: Any,
+) -> dict[str, Any]:
+    response = {"delta": delta, **extra}
+    if msg.get("full_snapshot"):
+        response["data"] = await _build_auth_response_data(hass)
+
+    return response
+
+
 async def _load_legacy_auth_payloads(hass: HomeAssistant) -> list[dict[str, Any]]:
     payloads: list[dict[str, Any]] = []
 
@@ -90,7 +164,7 @@ async def _load_legacy_auth_payloads(hass: HomeAssistant) -> list[dict[str, Any]
         if not os.path.exists(absolute_path):
             continue
 
-        legacy_data = await get_json_file(absolute_path)
+        legacy_data = await get_json_file(hass, absolute_path)
         if not isinstance(legacy_data, dict):
             continue
 
@@ -173,7 +247,7 @@ async def migrate_legacy_auth_data(hass: HomeAssistant) -> None:
             changed = True
 
     if changed:
-        await _persist_auth_store(hass)
+        _schedule_auth_store_save(hass)
         await _sync_group_dashboards_to_users(hass)
 
     new_auth_path = hass.config.path(NEW_AUTH_PATH)
@@ -185,6 +259,7 @@ async def migrate_legacy_auth_data(hass: HomeAssistant) -> None:
     vol.Required("type"): "ha_access_control/create_group",
     vol.Required("name"): str,
     vol.Optional("source_group_id"): str,
+    vol.Optional("full_snapshot", default=False): bool,
 })
 @websocket_api.require_admin
 @websocket_api.async_response
@@ -212,7 +287,9 @@ async def create_group(
             connection.send_error(msg["id"], "system_group", "System groups cannot be duplicated.")
             return
 
-        source_dashboards = copy.deepcopy((await _load_group_dashboard_permissions(hass)).get(source_group_id, {}))
+        source_dashboards = copy.deepcopy(
+            (await async_get_group_dashboard_permissions(hass)).groups.get(source_group_id, {})
+        )
 
     resolved_name, group_id = _resolve_unique_group_identity(auth_data, group_name)
 
@@ -223,20 +300,22 @@ async def create_group(
         policy=policy,
         system_generated=False,
     )
-    await _persist_auth_store(hass)
+    _schedule_auth_store_save(hass)
 
     if source_dashboards:
-        await _save_group_dashboards(hass, group_id, source_dashboards)
+        (await async_get_group_dashboard_permissions(hass)).async_set(group_id, source_dashboards)
 
-    await _sync_group_dashboards_to_users(hass)
-    response_data = await _build_auth_response_data(hass)
+    # A freshly created group has no linked users, so no view visibility changes.
+    delta = await _build_auth_delta(hass, group_ids=[group_id])
     connection.send_result(
         msg["id"],
-        {
-            "data": response_data,
-            "group_id": group_id,
-            "group_name": resolved_name,
-        },
+        await _build_mutation_response(
+            hass,
+            msg,
+            delta,
+            group_id=group_id,
+            group_name=resolved_name,
+        ),
     )
 
 
@@ -244,6 +323,7 @@ async def create_group(
     vol.Required("type"): "ha_access_control/rename_group",
     vol.Required("group_id"): str,
     vol.Required("new_name"): str,
+    vol.Optional("full_snapshot", default=False): bool,
 })
 @websocket_api.require_admin
 @websocket_api.async_response
@@ -279,29 +359,43 @@ async def rename_group(
     )
 
     group_to_rename.name = resolved_name
+    linked_user_ids: list[str] = []
     if new_group_id != group_id:
         auth_store._groups.pop(group_id, None)
         group_to_rename.id = new_group_id
         auth_store._groups[new_group_id] = group_to_rename
-        await _rename_group_dashboards(hass, group_id, new_group_id)
+        (await async_get_group_dashboard_permissions(hass)).async_rename(group_id, new_group_id)
+        linked_user_ids = [
+            user.id
+            for user in await hass.auth.async_get_users()
+            if any(group is group_to_rename for group in user.groups)
+        ]
 
-    await _persist_auth_store(hass)
-    await _sync_group_dashboards_to_users(hass)
-    response_data = await _build_auth_response_data(hass)
+    # Users keep the same group object, so the resolved view visibility is unchanged.
+    _schedule_auth_store_save(hass)
+    delta = await _build_auth_delta(
+        hass,
+        group_ids=[new_group_id],
+        user_ids=linked_user_ids,
+        removed_group_ids=[group_id] if new_group_id != group_id else [],
+    )
     connection.send_result(
         msg["id"],
-        {
-            "data": response_data,
-            "old_group_id": group_id,
-            "group_id": new_group_id,
-            "group_name": resolved_name,
-        },
+        await _build_mutation_response(
+            hass,
+            msg,
+            delta,
+            old_group_id=group_id,
+            group_id=new_group_id,
+            group_name=resolved_name,
+        ),
     )
 
 
 @websocket_api.websocket_command({
     vol.Required("type"): "ha_access_control/delete_group",
     vol.Required("group_id"): str,
+    vol.Optional("full_snapshot", default=False): bool,
 })
 @websocket_api.require_admin
 @websocket_api.async_response
@@ -332,17 +426,21 @@ async def delete_group(
         )
         return
 
+    # Only groups without linked users can be deleted, so no view visibility changes.
     auth_store._groups.pop(group_id, None)
-    await _persist_auth_store(hass)
-    await _delete_group_dashboards(hass, group_id)
-    await _sync_group_dashboards_to_users(hass)
-    response_data = await _build_auth_response_data(hass)
-    connection.send_result(msg["id"], {"data": response_data, "group_id": group_id})
+    _schedule_auth_store_save(hass)
+    (await async_get_group_dashboard_permissions(hass)).async_delete(group_id)
+    delta = await _build_auth_delta(hass, removed_group_ids=[group_id])
+    connection.send_result(
+        msg["id"],
+        await _build_mutation_response(hass, msg, delta, group_id=group_id),
+    )
 
 @websocket_api.websocket_command({
     vol.Required("type"): "ha_access_control/set_auths",
     vol.Required("isAnUser"): bool,
     vol.Required("data"): dict,
+    vol.Optional("full_snapshot", default=False): bool,
 })
 @websocket_api.require_admin
 @websocket_api.async_response
@@ -354,56 +452,191 @@ async def set_auths(
         return
 
     try:
-        await save_auths(hass, msg)
+        update = await _prepare_auth_update(hass, msg["isAnUser"], msg["data"])
+        changes = await _apply_auth_updates(hass, [update])
+    except (RuntimeError, ValueError) as err:
+        connection.send_error(msg["id"], "save_error", str(err))
+        return
+
+    delta = await _build_updates_delta(hass, [update], changes)
+    connection.send_result(msg["id"], await _build_mutation_response(hass, msg, delta))
+
+
+@websocket_api.websocket_command({
+    vol.Required("type"): "ha_access_control/set_auths_batch",
+    vol.Required("items"): [
+        {
+            vol.Required("isAnUser"): bool,
+            vol.Required("data"): dict,
+        }
+    ],
+    vol.Optional("full_snapshot", default=False): bool,
+})
+@websocket_api.require_admin
+@websocket_api.async_response
+async def set_auths_batch(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    updates: list[dict[str, Any]] = []
+    for index, item in enumerate(msg["items"]):
+        try:
+            updates.append(await _prepare_auth_update(hass, item["isAnUser"], item["data"]))
+        except (RuntimeError, ValueError) as err:
+            connection.send_error(msg["id"], "invalid_item", f"Item {index}: {err}")
+            return
+
+    try:
+        changes = await _apply_auth_updates(hass, updates)
     except (RuntimeError, ValueError) as err:
         connection.send_error(msg["id"], "save_error", str(err))
         return
 
-    response_data = await _build_auth_response_data(hass)
-    connection.send_result(msg["id"], response_data)
+    delta = await _build_updates_delta(hass, updates, changes)
+    connection.send_result(
+        msg["id"],
+        await _build_mutation_response(
+            hass,
+            msg,
+            delta,
+            results=[
+                {
+                    "id": update["id"],
+                    "isAnUser": update["is_user"],
+                    "changed": changed,
+                }
+                for update, changed in zip(updates, changes)
+            ],
+        ),
+    )
+
 
+async def _build_updates_delta(
+    hass: HomeAssistant,
+    updates: list[dict[str, Any]],
+    changes: list[bool],
+) -> dict[str, Any]:
+    changed_updates = [update for update, changed in zip(updates, changes) if changed]
+    return await _build_auth_delta(
+        hass,
+        group_ids=[update["id"] for update in changed_updates if not update["is_user"]],
+        user_ids=[update["id"] for update in changed_updates if update["is_user"]],
+    )
 
-async def save_auths(hass: HomeAssistant, msg: dict[str, Any]) -> None:
-    dashboards_payload_present = isinstance(msg.get("data"), dict) and "dashboards" in msg["data"]
-    dashboards_payload: dict[str, Any] = {}
-    if dashboards_payload_present:
-        raw_dashboards = msg["data"].get("dashboards")
-        if isinstance(raw_dashboards, dict):
-            dashboards_payload = raw_dashboards
 
-    sanitized_data = {k: v for k, v in msg["data"].items() if k != "dashboards"}
-    entity_id = sanitized_data.get("id")
+async def _prepare_auth_update(hass: HomeAssistant, is_user: bool, data: Any) -> dict[str, Any]:
+    """Validate one user or group update without applying anything."""
+    if not isinstance(data, dict):
+        raise ValueError("Invalid auth payload.")
+
+    entity_id = data.get("id")
     if not isinstance(entity_id, str) or not entity_id:
         raise ValueError("Invalid auth entity id.")
 
-    if msg["isAnUser"]:
+    if is_user:
         user = await hass.auth.async_get_user(entity_id)
         if user is None:
             raise ValueError("User not found.")
 
-        await hass.auth.async_update_user(
-            user,
-            group_ids=_normalize_group_ids(sanitized_data.get("group_ids")),
-        )
-        await _persist_auth_store(hass)
-        await _sync_group_dashboards_to_users(hass)
-        return
+        group_ids = _normalize_group_ids(data.get("group_ids"))
+        known_groups = _get_auth_store(hass)._groups
+        if any(group_id not in known_groups for group_id in group_ids):
+            raise ValueError("Invalid group specified.")
 
-    auth_store = _get_auth_store(hass)
-    group = auth_store._groups.get(entity_id)
+        return {
+            "is_user": True,
+            "id": entity_id,
+            "user": user,
+            "group_ids": group_ids,
+        }
+
+    group = _get_auth_store(hass)._groups.get(entity_id)
     if group is None:
         raise ValueError("Group not found.")
 
-    if dashboards_payload_present:
-        await _save_group_dashboards(hass, entity_id, dashboards_payload)
+    update: dict[str, Any] = {"is_user": False, "id": entity_id, "group": group}
+    if "dashboards" in data:
+        raw_dashboards = data.get("dashboards")
+        update["dashboards"] = raw_dashboards if isinstance(raw_dashboards, dict) else {}
 
     if not _is_protected_system_group(group):
-        raw_policy = sanitized_data.get("policy")
-        group.policy = copy.deepcopy(raw_policy) if isinstance(raw_policy, dict) else _build_default_group_policy()
-        await _invalidate_users_for_group(hass, entity_id)
-        await _persist_auth_store(hass)
+        raw_policy = data.get("policy")
+        update["policy"] = copy.deepcopy(raw_policy) if isinstance(raw_policy, dict) else _build_default_group_policy()
+
+    return update
 
-    await _sync_group_dashboards_to_users(hass)
+
+async def _apply_auth_updates(hass: HomeAssistant, updates: list[dict[str, Any]]) -> list[bool]:
+    """Apply validated updates in one pass: one auth save and one sync."""
+    permissions = await async_get_group_dashboard_permissions(hass)
+    dashboards_map = permissions.groups
+    dirty_dashboard_ids: set[str] | None = set()
+    changes = [False] * len(updates)
+
+    # Apply memberships first so group dashboard changes see the final set of linked users.
+    for index, update in enumerate(updates):
+        if not update["is_user"]:
+            continue
+
+        user = update["user"]
+        group_ids = update["group_ids"]
+        previous_group_ids = _normalize_group_ids([group.id for group in user.groups])
+        changed_group_ids = set(previous_group_ids).symmetric_difference(group_ids)
+        if not changed_group_ids:
+            continue
+
+        # The auth store schedules its own delayed save when a user is updated.
+        await hass.auth.async_update_user(user, group_ids=group_ids)
+        dirty_dashboard_ids = _merge_dashboard_ids(
+            dirty_dashboard_ids,
+            _dashboard_ids_for_groups(dashboards_map, changed_group_ids),
+        )
+        changes[index] = True
+
+    linked_group_ids = {
+        group.id
+        for user in await hass.auth.async_get_users()
+        for group in user.groups
+    }
+    auth_changed = False
+
+    for index, update in enumerate(updates):
+        if update["is_user"]:
+            continue
+
+        group_id = update["id"]
+        if "dashboards" in update:
+            previous_dashboards = dashboards_map.get(group_id)
+            if previous_dashboards != update["dashboards"]:
+                permissions.async_set(group_id, update["dashboards"])
+                changes[index] = True
+                if group_id in linked_group_ids:
+                    dirty_dashboard_ids = _merge_dashboard_ids(
+                        dirty_dashboard_ids,
+                        _changed_group_dashboard_ids(previous_dashboards, update["dashboards"]),
+                    )
+
+        group = update["group"]
+        if "policy" in update and update["policy"] != group.policy:
+            group.policy = update["policy"]
+            await _invalidate_users_for_group(hass, group_id)
+            auth_changed = True
+            changes[index] = True
+
+    if auth_changed:
+        _schedule_auth_store_save(hass)
+
+    get_sync_scheduler(hass).async_schedule(dirty_dashboard_ids)
+    return changes
+
+
+def _merge_dashboard_ids(
+    dashboard_ids: set[str] | None,
+    other_dashboard_ids: set[str] | None,
+) -> set[str] | None:
+    if dashboard_ids is None or other_dashboard_ids is None:
+        return None
+
+    return dashboard_ids | other_dashboard_ids
 
 
 def _find_group(groups: list[Any], group_id: str) -> dict[str, Any] | None:
@@ -495,38 +728,29 @@ async def _save_user_dashboards(hass: HomeAssistant, user_id: str, dashboards: d
     if not user_id or not isinstance(dashboards, dict):
         return
 
-    dashboard_definitions = await _load_dashboard_definitions(hass)
+    repository = get_dashboard_repository(hass)
+    dashboard_filenames = dict(
+        await repository.async_targets(
+            {
+                dashboard_id
+                for dashboard_id, dashboard_state in dashboards.items()
+                if isinstance(dashboard_id, str) and dashboard_id and isinstance(dashboard_state, dict)
+            }
+        )
+    )
     active_user_ids = await _load_active_user_ids(hass)
     if user_id not in active_user_ids:
         active_user_ids.append(user_id)
 
-    for dashboard_id, dashboard_state in dashboards.items():
-        if not isinstance(dashboard_id, str) or not dashboard_id:
-            continue
+    runtime_dashboards = get_runtime_dashboards(hass)
 
-        if not isinstance(dashboard_state, dict):
-            continue
-
-        dashboard_info = dashboard_definitions.get(dashboard_id, {})
-        filename = dashboard_info.get("filename") if isinstance(dashboard_info, dict) else None
-        if not isinstance(filename, str) or not filename:
-            filename = LOVELACE_STORAGE if dashboard_id == "lovelace" else f"{LOVELACE_STORAGE_PREFIX}{dashboard_id}"
-
-        storage, file_path = await _load_dashboard_storage(hass, dashboard_id, filename)
-        if not isinstance(storage, dict) or not file_path:
-            continue
-
-        data = storage.get("data")
-        if not isinstance(data, dict):
-            continue
-
-        config = data.get("config")
-        if not isinstance(config, dict):
-            continue
-
-        views = config.get("views")
+    async def _save_dashboard(dashboard_id: str, dashboard_state: dict[str, Any]) -> None:
+        dashboard = await repository.async_load(
+            dashboard_id, dashboard_filenames[dashboard_id], runtime_dashboards
+        )
+        views = dashboard.config.get("views") if dashboard else None
         if not isinstance(views, list):
-            continue
+            return
 
         view_states = dashboard_state.get("views")
         dashboard_visible = dashboard_state.get("visible")
@@ -551,44 +775,16 @@ async def _save_user_dashboards(hass: HomeAssistant, user_id: str, dashboards: d
                 changed = True
 
         if changed:
-            await save_json_file(file_path, storage)
-
-
-async def _load_dashboard_definitions(hass: HomeAssistant) -> dict[str, dict[str, Any]]:
-    dashboards_store = await get_json_file(hass.config.path(LOVELACE_DASHBOARDS_PATH))
-    if not isinstance(dashboards_store, dict):
-        return {}
-
-    data = dashboards_store.get("data")
-    if not isinstance(data, dict):
-        return {}
-
-    result: dict[str, dict[str, Any]] = {}
-
-    items = data.get("items")
-    if isinstance(items, list):
-        for item in items:
-            if not isinstance(item, dict):
-                continue
-
-            dashboard_id = item.get("id")
-            if not isinstance(dashboard_id, str) or not dashboard_id:
-                continue
-
-            result[dashboard_id] = item
-
-    dashboards = data.get("dashboards")
-    if isinstance(dashboards, dict):
-        for dashboard_id, dashboard_info in dashboards.items():
-            if not isinstance(dashboard_id, str) or not dashboard_id:
-                continue
+            await dashboard.async_save(hass)
 
-            if dashboard_id in result:
-                continue
-
-            result[dashboard_id] = dashboard_info if isinstance(dashboard_info, dict) else {}
-
-    return result
+    await gather_with_concurrency(
+        DASHBOARD_IO_CONCURRENCY,
+        (
+            _save_dashboard(dashboard_id, dashboard_state)
+            for dashboard_id, dashboard_state in dashboards.items()
+            if isinstance(dashboard_id, str) and dashboard_id and isinstance(dashboard_state, dict)
+        ),
+    )
 
 
 async def _load_active_user_ids(hass: HomeAssistant) -> list[str]:
@@ -606,31 +802,6 @@ async def _load_active_user_ids(hass: HomeAssistant) -> list[str]:
     return user_ids
 
 
-async def _load_dashboard_storage(
-    hass: HomeAssistant,
-    dashboard_id: str,
-    filename: str,
-) -> tuple[dict[str, Any] | None, str | None]:
-    candidates = [filename]
-    if dashboard_id == "lovelace":
-        fallback_filename = f"{LOVELACE_STORAGE_PREFIX}lovelace"
-        if filename == LOVELACE_STORAGE:
-            candidates = [fallback_filename, filename]
-        elif fallback_filename not in candidates:
-            candidates.append(fallback_filename)
-
-    for candidate in candidates:
-        file_path = hass.config.path(candidate)
-        if not os.path.exists(file_path):
-            continue
-
-        storage = await get_json_file(file_path)
-        if isinstance(storage, dict):
-            return storage, file_path
-
-    return None, None
-
-
 def _build_view_id(dashboard_id: str, view: dict[str, Any], index: int) -> str:
     path = view.get("path")
     if isinstance(path, str) and path:
@@ -690,70 +861,6 @@ def _set_user_view_visibility(
     return True
 
 
-async def _save_group_dashboards(hass: HomeAssistant, group_id: str, dashboards: dict[str, Any]) -> None:
-    file_path = hass.config.path(GROUP_DASHBOARD_PERMISSIONS_PATH)
-    dashboards_store = await get_json_file(file_path) or {}
-
-    if not isinstance(dashboards_store, dict):
-        dashboards_store = {}
-
-    groups = dashboards_store.get("groups")
-    if not isinstance(groups, dict):
-        groups = {}
-
-    groups[group_id] = dashboards
-    dashboards_store["groups"] = groups
-
-    await save_json_file(file_path, dashboards_store)
-
-
-async def _rename_group_dashboards(
-    hass: HomeAssistant,
-    old_group_id: str,
-    new_group_id: str,
-) -> None:
-    if old_group_id == new_group_id:
-        return
-
-    file_path = hass.config.path(GROUP_DASHBOARD_PERMISSIONS_PATH)
-    dashboards_store = await get_json_file(file_path)
-    if not isinstance(dashboards_store, dict):
-        return
-
-    groups = dashboards_store.get("groups")
-    if not isinstance(groups, dict) or old_group_id not in groups:
-        return
-
-    groups[new_group_id] = groups.pop(old_group_id)
-    dashboards_store["groups"] = groups
-    await save_json_file(file_path, dashboards_store)
-
-
-async def _delete_group_dashboards(hass: HomeAssistant, group_id: str) -> None:
-    file_path = hass.config.path(GROUP_DASHBOARD_PERMISSIONS_PATH)
-    dashboards_store = await get_json_file(file_path)
-    if not isinstance(dashboards_store, dict):
-        return
-
-    groups = dashboards_store.get("groups")
-    if not isinstance(groups, dict) or group_id not in groups:
-        return
-
-    groups.pop(group_id, None)
-    dashboards_store["groups"] = groups
-    await save_json_file(file_path, dashboards_store)
-
-
-async def _load_group_dashboard_permissions(hass: HomeAssistant) -> dict[str, Any]:
-    file_path = hass.config.path(GROUP_DASHBOARD_PERMISSIONS_PATH)
-    dashboards_store = await get_json_file(file_path)
-    if not isinstance(dashboards_store, dict):
-        return {}
-
-    groups = dashboards_store.get("groups")
-    return groups if isinstance(groups, dict) else {}
-
-
 def _normalize_group_ids(group_ids: Any) -> list[str]:
     if not isinstance(group_ids, list):
         return []
@@ -783,46 +890,44 @@ async def _load_runtime_user_group_ids(hass: HomeAssistant) -> dict[str, list[st
     return user_group_ids
 
 
-def _is_group_view_visible(
-    group_dashboards: dict[str, Any] | None,
-    dashboard_id: str,
-    view_id: str,
-) -> bool:
-    if not isinstance(group_dashboards, dict):
-        return False
+def _dashboard_ids_for_groups(
+    dashboards_map: dict[str, Any],
+    group_ids: set[str] | list[str],
+) -> set[str] | None:
+    """Return dashboards whose visibility depends on the given groups, or None for all."""
+    dashboard_ids: set[str] = set()
 
-    dashboard_state = group_dashboards.get(dashboard_id)
-    if not isinstance(dashboard_state, dict):
-        return False
+    for group_id in group_ids:
+        if group_id in SYSTEM_GROUPS_WITH_FULL_DASHBOARD_ACCESS:
+            return None
 
-    view_states = dashboard_state.get("views")
-    if isinstance(view_states, dict) and view_id in view_states:
-        return view_states.get(view_id) is True
+        group_dashboards = dashboards_map.get(group_id)
+        if not isinstance(group_dashboards, dict):
+            continue
 
-    return dashboard_state.get("visible") is True
+        dashboard_ids.update(
+            dashboard_id
+            for dashboard_id in group_dashboards
+            if isinstance(dashboard_id, str) and dashboard_id
+        )
 
+    return dashboard_ids
 
-def _resolve_allowed_user_ids_for_view(
-    user_group_ids: dict[str, list[str]],
-    dashboards_map: dict[str, Any],
-    dashboard_id: str,
-    view_id: str,
-) -> list[str]:
-    allowed_user_ids: list[str] = []
-
-    for user_id, group_ids in user_group_ids.items():
-        normalized_group_ids = _normalize_group_ids(group_ids)
-        if any(group_id in SYSTEM_GROUPS_WITH_FULL_DASHBOARD_ACCESS for group_id in normalized_group_ids):
-            allowed_user_ids.append(user_id)
-            continue
 
-        if any(
-            _is_group_view_visible(dashboards_map.get(group_id), dashboard_id, view_id)
-            for group_id in normalized_group_ids
-        ):
-            allowed_user_ids.append(user_id)
+def _changed_group_dashboard_ids(
+    previous_dashboards: dict[str, Any] | None,
+    dashboards: dict[str, Any] | None,
+) -> set[str]:
+    previous_dashboards = previous_dashboards if isinstance(previous_dashboards, dict) else {}
+    dashboards = dashboards if isinstance(dashboards, dict) else {}
 
-    return allowed_user_ids
+    return {
+        dashboard_id
+        for dashboard_id in set(previous_dashboards) | set(dashboards)
+        if isinstance(dashboard_id, str)
+        and dashboard_id
+        and previous_dashboards.get(dashboard_id) != dashboards.get(dashboard_id)
+    }
 
 
 def _set_view_visible_users(view: dict[str, Any], allowed_user_ids: list[str]) -> bool:
@@ -844,89 +949,67 @@ def _set_view_visible_users(view: dict[str, Any], allowed_user_ids: list[str]) -
     return True
 
 
-async def _collect_dashboard_targets(hass: HomeAssistant) -> list[tuple[str, str]]:
-    dashboard_definitions = await _load_dashboard_definitions(hass)
-    targets: dict[str, str] = {"lovelace": LOVELACE_STORAGE}
-
-    for dashboard_id, dashboard_info in dashboard_definitions.items():
-        if not isinstance(dashboard_id, str) or not dashboard_id:
-            continue
-
-        filename = dashboard_info.get("filename") if isinstance(dashboard_info, dict) else None
-        if not isinstance(filename, str) or not filename:
-            filename = LOVELACE_STORAGE if dashboard_id == "lovelace" else f"{LOVELACE_STORAGE_PREFIX}{dashboard_id}"
-
-        targets[dashboard_id] = filename
-
-    try:
-        storage_files = await hass.async_add_executor_job(
-            os.listdir,
-            hass.config.path(LOVELACE_STORAGE_DIR),
-        )
-    except FileNotFoundError:
-        storage_files = []
-
-    for filename in storage_files:
-        if not filename.startswith("lovelace."):
-            continue
-
-        dashboard_id = filename[len("lovelace.") :]
-        if not dashboard_id or dashboard_id in targets:
-            continue
-
-        targets[dashboard_id] = f"{LOVELACE_STORAGE_PREFIX}{dashboard_id}"
-
-    return list(targets.items())
-
+async def _sync_group_dashboards_to_users(
+    hass: HomeAssistant,
+    dashboard_ids: set[str] | None = None,
+) -> None:
+    """Recompute view visibility for the given dashboards, or every dashboard when None."""
+    if dashboard_ids is not None and not dashboard_ids:
+        return
 
-async def _sync_group_dashboards_to_users(hass: HomeAssistant) -> None:
     user_group_ids = await _load_runtime_user_group_ids(hass)
     if not user_group_ids:
         return
 
-    dashboards_map = await _load_group_dashboard_permissions(hass)
-    dashboard_targets = await _collect_dashboard_targets(hass)
+    dashboards_map = (await async_get_group_dashboard_permissions(hass)).groups
+    permission_index = ViewPermissionIndex(user_group_ids, dashboards_map)
+    repository = get_dashboard_repository(hass)
+    dashboard_targets = await repository.async_targets(dashboard_ids)
+    runtime_dashboards = get_runtime_dashboards(hass)
 
-    for dashboard_id, filename in dashboard_targets:
-        storage, file_path = await _load_dashboard_storage(hass, dashboard_id, filename)
-        if not isinstance(storage, dict) or not file_path:
-            continue
+    await gather_with_concurrency(
+        DASHBOARD_IO_CONCURRENCY,
+        (
+            _sync_dashboard_views(hass, repository, permission_index, dashboard_id, filename, runtime_dashboards)
+            for dashboard_id, filename in dashboard_targets
+        ),
+    )
 
-        data = storage.get("data")
-        if not isinstance(data, dict):
-            continue
 
-        config = data.get("config")
-        if not isinstance(config, dict):
-            continue
+async def _sync_dashboard_views(
+    hass: HomeAssistant,
+    repository: DashboardRepository,
+    permission_index: ViewPermissionIndex,
+    dashboard_id: str,
+    filename: str,
+    runtime_dashboards: dict[str, Any],
+) -> None:
+    dashboard = await repository.async_load(dashboard_id, filename, runtime_dashboards)
+    views = dashboard.config.get("views") if dashboard else None
+    if not isinstance(views, list):
+        return
 
-        views = config.get("views")
-        if not isinstance(views, list):
+    changed = False
+    for index, view in enumerate(views):
+        if not isinstance(view, dict):
             continue
 
-        changed = False
-        for index, view in enumerate(views):
-            if not isinstance(view, dict):
-                continue
-
-            view_id = _build_view_id(dashboard_id, view, index)
-            allowed_user_ids = _resolve_allowed_user_ids_for_view(
-                user_group_ids,
-                dashboards_map,
-                dashboard_id,
-                view_id,
-            )
+        view_id = _build_view_id(dashboard_id, view, index)
+        allowed_user_ids = permission_index.allowed_user_ids(dashboard_id, view_id)
+        if _set_view_visible_users(view, allowed_user_ids):
+            changed = True
 
-            if _set_view_visible_users(view, allowed_user_ids):
-                changed = True
+    if changed:
+        await dashboard.async_save(hass)
 
-        if changed:
-            await save_json_file(file_path, storage)
 
+async def async_sync_group_dashboards_to_users(hass: HomeAssistant, immediate: bool = True) -> None:
+    """Synchronize Lovelace view visibility from ACM group dashboard permissions.
 
-async def async_sync_group_dashboards_to_users(hass: HomeAssistant) -> None:
-    """Synchronize Lovelace view visibility from ACM group dashboard permissions."""
-    await _sync_group_dashboards_to_users(hass)
+    With ``immediate=False`` the full sync is coalesced with pending permission
+    edits and runs once the configured sync delay elapses.
+    """
+    await get_sync_scheduler(hass).async_request(None, immediate=immediate)
 
 
 async def _attach_group_dashboards(hass: HomeAssistant, auth_data: dict[str, Any] | None) -> None:
@@ -937,11 +1020,7 @@ async def _attach_group_dashboards(hass: HomeAssistant, auth_data: dict[str, Any
     if not isinstance(groups, list):
         return
 
-    file_path = hass.config.path(GROUP_DASHBOARD_PERMISSIONS_PATH)
-    dashboards_store = await get_json_file(file_path) or {}
-    dashboards_map = dashboards_store.get("groups")
-    if not isinstance(dashboards_map, dict):
-        dashboards_map = {}
+    dashboards_map = (await async_get_group_dashboard_permissions(hass)).groups
 
     for group in groups:
         if not isinstance(group, dict):
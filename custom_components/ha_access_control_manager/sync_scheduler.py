@@ -0,0 +1,109 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DEFAULT_SYNC_DELAY
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class DashboardSyncScheduler:
+    """Coalesce bursts of permission edits into one dashboard sync.
+
+    Requests are merged into a pending dirty set (``None`` meaning every
+    dashboard) and flushed once ``delay`` seconds after the first request of a
+    burst, or immediately on demand and when Home Assistant stops.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        sync_func: Callable[[HomeAssistant, set[str] | None], Awaitable[None]],
+        delay: float = DEFAULT_SYNC_DELAY,
+    ) -> None:
+        self._hass = hass
+        self._sync_func = sync_func
+        self.delay = delay
+        self._lock = asyncio.Lock()
+        self._has_pending = False
+        self._pending_dashboard_ids: set[str] | None = set()
+        self._unsub_timer: Callable[[], None] | None = None
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._async_handle_stop)
+
+    @callback
+    def async_schedule(self, dashboard_ids: set[str] | None) -> None:
+        """Merge a request into the pending batch and arm the flush timer."""
+        if dashboard_ids is not None and not dashboard_ids:
+            return
+
+        self._merge_pending(dashboard_ids)
+
+        if self.delay <= 0:
+            self._hass.async_create_task(self._async_flush_logged())
+            return
+
+        if self._unsub_timer is None:
+            self._unsub_timer = async_call_later(self._hass, self.delay, self._async_timer_fired)
+
+    async def async_request(
+        self,
+        dashboard_ids: set[str] | None,
+        immediate: bool = False,
+    ) -> None:
+        self.async_schedule(dashboard_ids)
+        if immediate:
+            await self.async_flush()
+
+    async def async_flush(self) -> None:
+        """Run the pending sync now, if any."""
+        self._cancel_timer()
+
+        async with self._lock:
+            if not self._has_pending:
+                return
+
+            dashboard_ids = self._pending_dashboard_ids
+            self._has_pending = False
+            self._pending_dashboard_ids = set()
+
+            try:
+                await self._sync_func(self._hass, dashboard_ids)
+            except Exception:
+                # Keep the failed batch dirty so the next flush retries it.
+                self._merge_pending(dashboard_ids)
+                raise
+
+    @callback
+    def _merge_pending(self, dashboard_ids: set[str] | None) -> None:
+        if dashboard_ids is None or self._pending_dashboard_ids is None:
+            self._pending_dashboard_ids = None
+        else:
+            self._pending_dashboard_ids.update(dashboard_ids)
+
+        self._has_pending = True
+
+    @callback
+    def _async_timer_fired(self, _now: Any) -> None:
+        self._unsub_timer = None
+        self._hass.async_create_task(self._async_flush_logged())
+
+    async def _async_flush_logged(self) -> None:
+        try:
+            await self.async_flush()
+        except Exception:  # noqa: BLE001 - background task, keep the scheduler alive
+            _LOGGER.exception("Error while synchronizing dashboard visibility")
+
+    async def _async_handle_stop(self, _event: Event) -> None:
+        await self._async_flush_logged()
+
+    @callback
+    def _cancel_timer(self) -> None:
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
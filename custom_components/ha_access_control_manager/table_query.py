@@ -0,0 +1,197 @@
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_TABLE_INDEXES, DEFAULT_PAGE_SIZE, DOMAIN, MAX_PAGE_SIZE
+from .revisions import content_revision
+
+NONE_VALUE = "__none__"
+
+QUERY_SCHEMA = {
+    vol.Optional("search"): str,
+    vol.Optional("filters"): {str: [str]},
+    vol.Optional("sort"): str,
+    vol.Optional("descending"): bool,
+    vol.Optional("offset"): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    vol.Optional("limit"): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_PAGE_SIZE)),
+}
+QUERY_KEYS = ("rows", "search", "filters", "sort", "descending", "offset", "limit")
+
+
+class TableSpec:
+    """Facets and sort keys a table supports, and how to describe one of its rows."""
+
+    __slots__ = ("name", "facets", "sort_keys", "describe")
+
+    def __init__(
+        self,
+        name: str,
+        facets: Iterable[str],
+        sort_keys: Iterable[str],
+        describe: Callable[[dict[str, Any]], "RowDescription"],
+    ) -> None:
+        self.name = name
+        self.facets = tuple(facets)
+        self.sort_keys = tuple(sort_keys)
+        self.describe = describe
+
+
+class RowDescription:
+    """What a table index needs to know about one row."""
+
+    __slots__ = ("search_text", "facets", "sort_values")
+
+    def __init__(
+        self,
+        search_values: Iterable[Any],
+        facets: dict[str, Iterable[str]],
+        sort_values: dict[str, Any],
+    ) -> None:
+        self.search_text = "\n".join(str(value).lower() for value in search_values if value)
+        self.facets = facets
+        self.sort_values = sort_values
+
+
+class InvalidQuery(ValueError):
+    """Raised for filter or sort keys a table does not support."""
+
+
+class TableIndex:
+    """Search text, inverted facet indexes and sort orders precomputed for a table.
+
+    Filters intersect facet posting sets (values within one facet are OR-ed,
+    facets are AND-ed, like the panel's advanced filters); search is a
+    substring scan over pre-lowered text of the remaining rows only.
+    """
+
+    def __init__(self, spec: TableSpec, rows: list[dict[str, Any]]) -> None:
+        self.rows = rows
+        self._search_texts: list[str] = []
+        self._facets: dict[str, dict[str, set[int]]] = {facet: {} for facet in spec.facets}
+        self._sort_values: dict[str, list[Any]] = {key: [None] * len(rows) for key in spec.sort_keys}
+        self._sort_orders: dict[str, list[int]] = {}
+
+        for position, row in enumerate(rows):
+            description = spec.describe(row)
+            self._search_texts.append(description.search_text)
+
+            for facet, values in description.facets.items():
+                postings = self._facets[facet]
+                for value in values:
+                    postings.setdefault(value, set()).add(position)
+
+            for sort_key, value in description.sort_values.items():
+                self._sort_values[sort_key][position] = value
+
+    def query(
+        self,
+        search: str | None = None,
+        filters: dict[str, list[str]] | None = None,
+        sort: str | None = None,
+        descending: bool = False,
+        offset: int = 0,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> tuple[int, list[dict[str, Any]]]:
+        candidates: set[int] | None = None
+        for facet, values in (filters or {}).items():
+            if not values:
+                continue
+
+            postings = self._facets.get(facet)
+            if postings is None:
+                raise InvalidQuery(f"Unsupported filter: {facet}")
+
+            matches: set[int] = set()
+            for value in values:
+                matches |= postings.get(value, set())
+
+            candidates = matches if candidates is None else candidates & matches
+            if not candidates:
+                return 0, []
+
+        needle = (search or "").strip().lower()
+        if needle:
+            pool = candidates if candidates is not None else range(len(self.rows))
+            candidates = {position for position in pool if needle in self._search_texts[position]}
+
+        order = self._sort_order(sort) if sort else range(len(self.rows))
+        if descending:
+            order = reversed(order)
+
+        positions = [position for position in order if candidates is None or position in candidates]
+        page = positions[offset:offset + limit]
+        return len(positions), [self.rows[position] for position in page]
+
+    def _sort_order(self, sort: str) -> list[int]:
+        order = self._sort_orders.get(sort)
+        if order is not None:
+            return order
+
+        values = self._sort_values.get(sort)
+        if values is None:
+            raise InvalidQuery(f"Unsupported sort key: {sort}")
+
+        order = self._sort_orders[sort] = sorted(
+            range(len(values)), key=lambda position: _sort_key(values[position])
+        )
+        return order
+
+
+def _sort_key(value: Any) -> tuple[int, Any]:
+    if value is None or value == "":
+        return (1, "")
+
+    return (0, value.lower() if isinstance(value, str) else value)
+
+
+def wants_query(msg: dict[str, Any]) -> bool:
+    return any(key in msg for key in QUERY_KEYS)
+
+
+def revision_extra(msg: dict[str, Any], projection_key: str | None) -> str | None:
+    """Extra revision component: a query page depends on its parameters too."""
+    if not wants_query(msg):
+        return projection_key
+
+    query = {key: msg[key] for key in QUERY_KEYS if key in msg}
+    return f"{projection_key or ''}|{content_revision(query)}"
+
+
+async def async_get_table_index(
+    hass: HomeAssistant,
+    spec: TableSpec,
+    revision: str,
+    rows_factory: Callable[[], Awaitable[list[dict[str, Any]]]],
+) -> TableIndex:
+    """Return the index of a table, rebuilding it only when ``revision`` moved."""
+    indexes = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_TABLE_INDEXES, {})
+    cached = indexes.get(spec.name)
+    if cached is not None and cached[0] == revision:
+        return cached[1]
+
+    index = TableIndex(spec, await rows_factory())
+    indexes[spec.name] = (revision, index)
+    return index
+
+
+def query_table(index: TableIndex, msg: dict[str, Any]) -> dict[str, Any]:
+    offset = msg.get("offset", 0)
+    limit = msg.get("limit", DEFAULT_PAGE_SIZE)
+    total, items = index.query(
+        search=msg.get("search"),
+        filters=msg.get("filters"),
+        sort=msg.get("sort"),
+        descending=msg.get("descending", False),
+        offset=offset,
+        limit=limit,
+    )
+
+    return {"total": total, "offset": offset, "limit": limit, "items": items}
+
+
+def none_if_empty(value: Any) -> list[str]:
+    """Facet values for an optional scalar, using the panel's ``__none__`` marker."""
+    return [value] if value else [NONE_VALUE]
@@ -0,0 +1,130 @@
+import asyncio
+from collections.abc import Iterable
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .dashboard_cache import async_file_fingerprint
+from .file_manager import get_json_file
+from .const import (
+    DATA_VIEW_INDEX,
+    DOMAIN,
+    VIEW_INDEX_SAVE_DELAY,
+    VIEW_INDEX_STORAGE_KEY,
+    VIEW_INDEX_STORAGE_VERSION,
+)
+
+
+def summarize_dashboard(config: dict[str, Any]) -> dict[str, Any]:
+    """What the dashboard listing reads from a config: its title and, per view,
+    its position, path, id, title and the users it is restricted to (None when
+    it is visible to everyone)."""
+    views = []
+    for index, view in enumerate(config.get("views", [])):
+        if not isinstance(view, dict):
+            continue
+
+        visible = view.get("visible")
+        if visible is None:
+            users = None
+        elif isinstance(visible, list):
+            users = [entry.get("user") for entry in visible if isinstance(entry, dict)]
+        else:
+            users = []
+
+        views.append(
+            {
+                "index": index,
+                "path": view.get("path"),
+                "id": view.get("id"),
+                "title": view.get("title"),
+                "users": users,
+            }
+        )
+
+    return {"title": config.get("title"), "views": views}
+
+
+class DashboardViewIndex:
+    """View summaries of dashboard storage files, keyed by path and fingerprint.
+
+    Persisted across restarts, a file is only parsed again when its
+    ``(mtime, size)`` changed, and the parsed card tree is dropped as soon as
+    it is summarized. Saves made by ACM refresh their entry directly.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._store: Store = Store(hass, VIEW_INDEX_STORAGE_VERSION, VIEW_INDEX_STORAGE_KEY)
+        self._entries: dict[str, dict[str, Any]] | None = None
+        self._load_lock = asyncio.Lock()
+
+    async def async_get(self, file_path: str) -> dict[str, Any] | None:
+        """Summary of the dashboard stored at ``file_path``, or None when it has no config."""
+        entries = await self._async_entries()
+        fingerprint = await async_file_fingerprint(self._hass, file_path)
+        if fingerprint is None:
+            self._discard(file_path)
+            return None
+
+        entry = entries.get(file_path)
+        if entry is not None and entry["fingerprint"] == list(fingerprint):
+            return entry["summary"]
+
+        storage = await get_json_file(self._hass, file_path)
+        data = storage.get("data") if isinstance(storage, dict) else None
+        config = data.get("config") if isinstance(data, dict) else None
+        if not isinstance(config, dict):
+            self._discard(file_path)
+            return None
+
+        summary = summarize_dashboard(config)
+        self._set(file_path, fingerprint, summary)
+        return summary
+
+    @callback
+    def async_update(self, file_path: str, fingerprint: tuple[int, int], config: dict[str, Any]) -> None:
+        """Refresh an entry from a config that was just written to ``file_path``."""
+        if self._entries is not None:
+            self._set(file_path, fingerprint, summarize_dashboard(config))
+
+    @callback
+    def async_retain(self, file_paths: Iterable[str]) -> None:
+        """Forget the files that are no longer part of any dashboard."""
+        if self._entries is None:
+            return
+
+        keep = set(file_paths)
+        for file_path in [path for path in self._entries if path not in keep]:
+            self._discard(file_path)
+
+    async def _async_entries(self) -> dict[str, dict[str, Any]]:
+        if self._entries is None:
+            async with self._load_lock:
+                if self._entries is None:
+                    stored = await self._store.async_load()
+                    entries = stored.get("entries") if isinstance(stored, dict) else None
+                    self._entries = entries if isinstance(entries, dict) else {}
+
+        return self._entries
+
+    def _set(self, file_path: str, fingerprint: tuple[int, int], summary: dict[str, Any]) -> None:
+        self._entries[file_path] = {"fingerprint": list(fingerprint), "summary": summary}
+        self._schedule_save()
+
+    def _discard(self, file_path: str) -> None:
+        if self._entries is not None and self._entries.pop(file_path, None) is not None:
+            self._schedule_save()
+
+    def _schedule_save(self) -> None:
+        self._store.async_delay_save(lambda: {"entries": self._entries}, VIEW_INDEX_SAVE_DELAY)
+
+
+def get_view_index(hass: HomeAssistant) -> DashboardViewIndex:
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    index = domain_data.get(DATA_VIEW_INDEX)
+    if index is None:
+        index = domain_data[DATA_VIEW_INDEX] = DashboardViewIndex(hass)
+
+    return index
@@ -5,6 +5,173 @@ const LitElement = window.LitElement || Object.getPrototypeOf(HaLitElement);
 const html = window.html || LitElement.prototype.html;
 const css = window.css || LitElement.prototype.css;
 
+// Last payload and revision per list command, kept for the lifetime of the page so
+// reopening the panel only costs a "not_modified" round-trip when nothing changed.
+const listCache = new Map();
+
+async function fetchWithRevision(hass, type, params = {}) {
+    const cacheKey = JSON.stringify({ type, ...params });
+    const cached = listCache.get(cacheKey);
+    const response = await hass.callWS({ type, ...params, revision: cached?.revision ?? null });
+    if (response.not_modified && cached) {
+        return structuredClone(cached.data);
+    }
+
+    listCache.set(cacheKey, { revision: response.revision, data: response.data });
+    return structuredClone(response.data);
+}
+
+// Query mode of the list commands for each filterable table: only row ids are
+// requested, since the rows themselves come from the registry mirror.
+const TABLE_QUERIES = {
+    devices: { type: 'ha_access_control/list_devices', params: { fields: ['id'] }, id: row => row.id },
+    entities: { type: 'ha_access_control/list_devices', params: { rows: 'entities', entity_fields: ['entity_id'] }, id: row => row.entity_id },
+    helpers: { type: 'ha_access_control/list_helpers', params: { fields: ['entity_id'] }, id: row => row.entity_id },
+};
+const QUERY_PAGE_SIZE = 1000;
+
+async function queryMatchingIds(hass, tableType, filters) {
+    const { type, params, id } = TABLE_QUERIES[tableType];
+    const ids = new Set();
+    let offset = 0;
+    for (;;) {
+        const { data } = await hass.callWS({ type, ...params, filters, offset, limit: QUERY_PAGE_SIZE });
+        data.items.forEach(row => ids.add(id(row)));
+        offset += data.items.length;
+        if (offset >= data.total || data.items.length === 0) {
+            return ids;
+        }
+    }
+}
+
+// Decode one table of a "columnar" payload back into row objects.
+function decodeColumnarTable(payload, table) {
+    const rows = Array.from({ length: table.count }, () => ({}));
+    Object.entries(table.columns).forEach(([column, values]) => {
+        const encoding = table.encodings?.[column];
+        const missing = new Set(table.missing?.[column] || []);
+        values.forEach((value, index) => {
+            if (missing.has(index)) {
+                return;
+            }
+            if (value !== null && encoding === 'string') {
+                value = payload.strings[value];
+            } else if (value !== null && encoding === 'objects') {
+                value = value.map(objectIndex => ({ ...payload.objects[objectIndex] }));
+            }
+            rows[index][column] = value;
+        });
+    });
+    return rows;
+}
+
+function decodeColumnar(payload) {
+    if (payload.rows) {
+        return decodeColumnarTable(payload, payload.rows);
+    }
+
+    const devices = decodeColumnarTable(payload, payload.devices);
+    if (payload.entities) {
+        devices.forEach(device => {
+            device.entities = [];
+        });
+        decodeColumnarTable(payload, payload.entities).forEach((entity, index) => {
+            devices[payload.entities.parent[index]].entities.push(entity);
+        });
+    }
+    return devices;
+}
+
+// Cache keys of the bootstrap sections. Account sections share theirs with the
+// list commands, whose revisions match the sections for the same profile.
+const ACCOUNT_CACHE_KEYS = {
+    users: JSON.stringify({ type: 'ha_access_control/list_users' }),
+    auths: JSON.stringify({ type: 'ha_access_control/list_auths' }),
+    dashboards: JSON.stringify({ type: 'ha_access_control/list_dashboards' }),
+};
+const REGISTRY_CACHE_KEYS = {
+    devices: JSON.stringify({ type: 'ha_access_control/subscribe_registries', section: 'devices', profile: 'panel' }),
+    helpers: JSON.stringify({ type: 'ha_access_control/subscribe_registries', section: 'helpers', profile: 'panel' }),
+    labels: JSON.stringify({ type: 'ha_access_control/subscribe_registries', section: 'labels' }),
+};
+
+// Devices, entities, helpers and labels as last pushed by the server, keyed by id,
+// so diffs can be applied without refetching.
+class RegistryMirror {
+    constructor() {
+        this.devices = new Map();
+        this.entities = new Map();
+        this.helpers = new Map();
+        this.labels = new Map();
+    }
+
+    loadSection(section, items) {
+        if (section === 'devices') {
+            this.devices.clear();
+            this.entities.clear();
+            items.forEach(({ entities, ...device }) => {
+                if (device.id !== 'withoutDevices') {
+                    this.devices.set(device.id, device);
+                }
+                (entities || []).forEach(entity => this.entities.set(entity.entity_id, entity));
+            });
+        } else if (section === 'helpers') {
+            this.helpers = new Map(items.map(helper => [helper.entity_id, helper]));
+        } else if (section === 'labels') {
+            this.labels = new Map(items.map(label => [label.id, label]));
+        }
+    }
+
+    applyDiff(diff) {
+        const sections = [
+            ['devices', this.devices, device => device.id],
+            ['entities', this.entities, entity => entity.entity_id],
+            ['helpers', this.helpers, helper => helper.entity_id],
+            ['labels', this.labels, label => label.id],
+        ];
+        sections.forEach(([section, items, key]) => {
+            const changes = diff[section];
+            if (!changes) {
+                return;
+            }
+            changes.removed.forEach(id => items.delete(id));
+            changes.updated.forEach(item => items.set(key(item), item));
+        });
+    }
+
+    deviceTree() {
+        const entitiesByDevice = new Map();
+        const withoutDevices = [];
+        this.entities.forEach(entity => {
+            if (entity.device_id && this.devices.has(entity.device_id)) {
+                if (!entitiesByDevice.has(entity.device_id)) {
+                    entitiesByDevice.set(entity.device_id, []);
+                }
+                entitiesByDevice.get(entity.device_id).push(entity);
+            } else {
+                withoutDevices.push(entity);
+            }
+        });
+
+        const devices = [...this.devices.values()].map(device => ({
+            ...device,
+            entities: entitiesByDevice.get(device.id) || []
+        }));
+        if (withoutDevices.length) {
+            devices.push({ id: 'withoutDevices', entities: withoutDevices });
+        }
+        return structuredClone(devices);
+    }
+
+    helperList() {
+        return structuredClone([...this.helpers.values()]);
+    }
+
+    labelList() {
+        return structuredClone([...this.labels.values()]);
+    }
+}
+
 class AccessControlManager extends LitElement {
     static get properties() {
         return {
@@ -45,6 +212,7 @@ class AccessControlManager extends LitElement {
             helperAdvancedFilters: { type: Object },
             advancedFilterPanels: { type: Object },
             advancedFilterSections: { type: Object },
+            facetMatches: { type: Object },
             _isSaving: { type: Boolean },
             restartDialogOpen: { type: Boolean },
             dashboardsCollapsed: { type: Boolean },
@@ -65,6 +233,7 @@ class AccessControlManager extends LitElement {
         this.entitiesWithoutDevices = [];
         this.dataUsers = [];
         this.dataGroups = [];
+        this.authRevision = 0;
         this.isAnUser = false;
         this.needToFetch = true;
         this.selected = {};
@@ -91,6 +260,8 @@ class AccessControlManager extends LitElement {
         this.helperAdvancedFilters = {};
         this.advancedFilterPanels = {};
         this.advancedFilterSections = {};
+        this.facetMatches = {};
+        this._facetQueryTokens = {};
         this._dashboardsTemplate = [];
         this._pendingDashboardSelection = null;
         this._isSaving = false;
@@ -276,30 +447,57 @@ class AccessControlManager extends LitElement {
         this[property] = filters;
     }
 
-    filterRowsByAdvancedFilters(rows, tableType) {
-        const activeFilters = Object.entries(this.getAdvancedFilters(tableType))
-            .filter(([, values]) => Array.isArray(values) && values.length > 0);
+    // Every advanced filter but permissions runs on the server, over its indexed
+    // tables; permissions depend on toggles that are not saved yet.
+    getServerFacetFilters(tableType) {
+        return Object.fromEntries(
+            Object.entries(this.getAdvancedFilters(tableType))
+                .filter(([filterKey, values]) => filterKey !== 'permissions' && Array.isArray(values) && values.length > 0)
+        );
+    }
 
-        if (activeFilters.length === 0) {
-            return rows;
+    refreshFacetMatches(tableType) {
+        const filters = this.getServerFacetFilters(tableType);
+        const token = (this._facetQueryTokens[tableType] || 0) + 1;
+        this._facetQueryTokens[tableType] = token;
+
+        if (Object.keys(filters).length === 0) {
+            this.facetMatches = { ...this.facetMatches, [tableType]: null };
+            return;
         }
 
-        return rows.filter(row => activeFilters.every(([filterKey, values]) => (
-            this.rowMatchesAdvancedFilter(row, tableType, filterKey, values)
-        )));
+        if (!this.facetMatches[tableType]) {
+            // Nothing matches until the server answered the first query.
+            this.facetMatches = { ...this.facetMatches, [tableType]: new Set() };
+        }
+
+        queryMatchingIds(this.hass, tableType, filters)
+            .then(ids => {
+                if (this._facetQueryTokens[tableType] === token) {
+                    this.facetMatches = { ...this.facetMatches, [tableType]: ids };
+                }
+            })
+            .catch(error => console.error(`Unable to filter ${tableType}:`, error));
     }
 
-    rowMatchesAdvancedFilter(row, tableType, filterKey, selectedValues) {
-        if (filterKey === 'permissions') {
-            return selectedValues.some(value => this.rowMatchesPermissionFilter(row, value));
-        }
+    refreshActiveFacetMatches() {
+        Object.keys(TABLE_QUERIES)
+            .filter(tableType => this.facetMatches[tableType])
+            .forEach(tableType => this.refreshFacetMatches(tableType));
+    }
+
+    filterRowsByAdvancedFilters(rows, tableType) {
+        const matches = this.facetMatches[tableType];
+        const permissionValues = this.getAdvancedFilterValues(tableType, 'permissions');
 
-        if (filterKey === 'status') {
-            return selectedValues.some(value => this.rowMatchesStatusFilter(row, tableType, value));
+        if (!matches && permissionValues.length === 0) {
+            return rows;
         }
 
-        const rowValues = this.getRowAdvancedFilterValues(row, filterKey);
-        return selectedValues.some(value => rowValues.includes(value));
+        return rows.filter(row => (
+            (!matches || matches.has(row.id))
+            && (permissionValues.length === 0 || permissionValues.some(value => this.rowMatchesPermissionFilter(row, value)))
+        ));
     }
 
     rowMatchesPermissionFilter(row, filterValue) {
@@ -321,21 +519,6 @@ class AccessControlManager extends LitElement {
         }
     }
 
-    rowMatchesStatusFilter(row, tableType, filterValue) {
-        switch (filterValue) {
-            case 'enabled':
-                return !row.disabled_by;
-            case 'disabled':
-                return Boolean(row.disabled_by);
-            case 'visible':
-                return tableType === 'devices' ? true : !row.hidden_by;
-            case 'hidden':
-                return tableType !== 'devices' && Boolean(row.hidden_by);
-            default:
-                return false;
-        }
-    }
-
     getStringFilterValues(value) {
         if (value === undefined || value === null) {
             return [];
@@ -369,27 +552,6 @@ class AccessControlManager extends LitElement {
         return device.integration ? [device.integration] : [];
     }
 
-    getRowAdvancedFilterValues(row, filterKey) {
-        switch (filterKey) {
-            case 'areas':
-                return row.area ? [row.area] : ['__none__'];
-            case 'integrations':
-                return this.getIntegrationFilterValues(row);
-            case 'devices':
-                return row.device_id ? [row.device_id] : ['__none__'];
-            case 'domains':
-                return row.domain ? [row.domain] : [];
-            case 'labels':
-                return (row.labels || []).map(label => label.id || label).filter(Boolean);
-            case 'categories':
-                return row.category_id ? [row.category_id] : ['__none__'];
-            case 'voice_assistants':
-                return (row.voice_assistants || []).map(assistant => assistant.id || assistant).filter(Boolean);
-            default:
-                return [];
-        }
-    }
-
     collectFilterOptions(rows, extractor) {
         const options = new Map();
 
@@ -541,51 +703,189 @@ class AccessControlManager extends LitElement {
 
     update(changedProperties) {
         if (changedProperties.has('hass') && this.hass && this.needToFetch) {
-            this.fetchUsers();
-            this.fetchAuths();
-            this.fetchDevices();
-            this.fetchDashboards();
-            this.fetchHelpers();
-            this.fetchLabels();
+            this.subscribeBootstrap();
             this.needToFetch = false;
         }
+        Object.keys(TABLE_QUERIES).forEach(tableType => {
+            if (changedProperties.has(this.getAdvancedFilterProperty(tableType))) {
+                this.refreshFacetMatches(tableType);
+            }
+        });
         super.update(changedProperties);
     }
 
-    fetchUsers() {
-        this.hass.callWS({ type: 'ha_access_control/list_users' }).then(users => {
-            this.users = users;
+    disconnectedCallback() {
+        super.disconnectedCallback();
+        this.unsubscribeBootstrap();
+        this.needToFetch = true;
+    }
+
+    subscribeBootstrap() {
+        this.unsubscribeBootstrap();
+        const mirror = new RegistryMirror();
+        const pending = { devices: [], helpers: [], labels: [] };
+        const revisions = {};
+        Object.entries({ ...ACCOUNT_CACHE_KEYS, ...REGISTRY_CACHE_KEYS }).forEach(([section, cacheKey]) => {
+            revisions[section] = listCache.get(cacheKey)?.revision ?? null;
+        });
+
+        this._bootstrapSubscription = this.hass.connection.subscribeMessage(message => {
+            if (message.error) {
+                // The server could not build the snapshot: load each list on its own.
+                console.error('Unable to bootstrap the panel:', message.error);
+                this.unsubscribeBootstrap();
+                this.loadWithoutBootstrap();
+                return;
+            }
+
+            if (message.diff) {
+                mirror.applyDiff(message.diff);
+                this.applyRegistryRows(mirror, true);
+                Object.entries(REGISTRY_CACHE_KEYS).forEach(([section, cacheKey]) => listCache.delete(cacheKey));
+                return;
+            }
+
+            if (message.ready) {
+                this.applyRegistryRows(mirror, false);
+                if (this.selected && !this.isAnUser && this.selected.id) {
+                    this.loadData(this.selected);
+                }
+                return;
+            }
+
+            if (message.section in ACCOUNT_CACHE_KEYS) {
+                const cacheKey = ACCOUNT_CACHE_KEYS[message.section];
+                if (!message.not_modified) {
+                    listCache.set(cacheKey, { revision: message.revision, data: message.data });
+                }
+                this.applyAccountSection(message.section, structuredClone(listCache.get(cacheKey)?.data));
+                return;
+            }
+
+            const cacheKey = REGISTRY_CACHE_KEYS[message.section];
+            if (message.columnar) {
+                pending[message.section].push(...decodeColumnar(message.columnar));
+            } else if (message.items) {
+                pending[message.section].push(...message.items);
+            } else if (message.not_modified) {
+                mirror.loadSection(message.section, listCache.get(cacheKey)?.data || []);
+            } else if (message.done) {
+                const items = pending[message.section];
+                pending[message.section] = [];
+                listCache.set(cacheKey, { revision: message.revision, data: items });
+                mirror.loadSection(message.section, items);
+            }
+        }, { type: 'ha_access_control/bootstrap', profile: 'panel', format: 'columnar', revisions });
+        this._bootstrapSubscription.catch(error => {
+            console.error('Unable to bootstrap the panel:', error);
+            this._bootstrapSubscription = null;
+            this.loadWithoutBootstrap();
         });
     }
 
-    fetchDevices() {
-        this.hass.callWS({ type: 'ha_access_control/list_devices' }).then(devices => {
-            const withoutDevices = devices.find(device => device.id === 'withoutDevices');
-            this.entitiesWithoutDevices = (withoutDevices?.entities || []).map(entity => ({
-                ...entity,
+    loadWithoutBootstrap() {
+        // Fallback without pushed diffs: every list fails or succeeds on its own.
+        Object.keys(ACCOUNT_CACHE_KEYS).forEach(section => {
+            fetchWithRevision(this.hass, `ha_access_control/list_${section}`)
+                .then(data => this.applyAccountSection(section, data))
+                .catch(error => console.error(`Unable to load ${section}:`, error));
+        });
+
+        Promise.all([
+            fetchWithRevision(this.hass, 'ha_access_control/list_devices', { profile: 'panel' }),
+            fetchWithRevision(this.hass, 'ha_access_control/list_helpers', { profile: 'panel' }),
+            fetchWithRevision(this.hass, 'ha_access_control/list_labels'),
+        ])
+            .then(([devices, helpers, labels]) => {
+                const mirror = new RegistryMirror();
+                mirror.loadSection('devices', devices);
+                mirror.loadSection('helpers', helpers);
+                mirror.loadSection('labels', labels);
+                this.applyRegistryRows(mirror, false);
+                if (this.selected && !this.isAnUser && this.selected.id) {
+                    this.loadData(this.selected);
+                }
+            })
+            .catch(error => console.error('Unable to load the registries:', error));
+    }
+
+    unsubscribeBootstrap() {
+        if (!this._bootstrapSubscription) {
+            return;
+        }
+        this._bootstrapSubscription.then(unsubscribe => unsubscribe()).catch(() => {});
+        this._bootstrapSubscription = null;
+    }
+
+    applyAccountSection(section, data) {
+        if (section === 'users') {
+            this.users = Array.isArray(data) ? data : [];
+        } else if (section === 'auths') {
+            this.loadAuths(data);
+        } else if (section === 'dashboards') {
+            this.initializeDashboardsData(Array.isArray(data) ? data : []);
+        }
+    }
+
+    applyRegistryRows(mirror, keepAccess) {
+        // Pushed changes must not drop read/write toggles the admin has not saved yet.
+        const previousAccess = new Map();
+        if (keepAccess) {
+            (this.tableData || []).forEach(device => device.entities.forEach(entity => previousAccess.set(entity.entity_id, entity)));
+            (this.entitiesWithoutDevices || []).forEach(entity => previousAccess.set(entity.entity_id, entity));
+            (this.helperTableData || []).forEach(helper => previousAccess.set(helper.entity_id, helper));
+        }
+
+        this.setDevices(mirror.deviceTree());
+        this.setHelpers(mirror.helperList());
+        this.labelTableData = mirror.labelList();
+        this.filterEntitiesWithoutDevices();
+        // The server tables moved with the registries: match the filters again.
+        this.refreshActiveFacetMatches();
+        if (!keepAccess) {
+            return;
+        }
+
+        const restoreAccess = item => {
+            const access = previousAccess.get(item.entity_id) || this.getPolicyAccess(this.selected, item.entity_id);
+            item.read = access.read;
+            item.write = access.write;
+        };
+        this.tableData.forEach(device => {
+            device.entities.forEach(restoreAccess);
+            device.read = this.getAggregateState(device.entities, 'read');
+            device.write = this.getAggregateState(device.entities, 'write');
+        });
+        this.entitiesWithoutDevices.forEach(restoreAccess);
+        this.helperTableData.forEach(restoreAccess);
+        this.tableData = [...this.tableData];
+        this.requestUpdate();
+    }
+
+    setDevices(devices) {
+        const withoutDevices = devices.find(device => device.id === 'withoutDevices');
+        const entitiesWithoutDevices = (withoutDevices?.entities || []).map(entity => ({
+            ...entity,
+            read: false,
+            write: false
+        }));
+        const rows = devices
+            .filter(device => device.id !== 'withoutDevices')
+            .map(device => ({
+                entities: device.entities,
+                name: device.name,
+                id: device.id,
+                integration: this.getDeviceIntegrationLabel(device),
+                integrations: device.integrations || [],
+                area: this.getDeviceAreaLabel(device),
+                disabled_by: device.disabled_by || null,
+                labels: device.labels || [],
                 read: false,
                 write: false
             }));
-            this.tableData = devices
-                .filter(device => device.id !== 'withoutDevices')
-                .map(device => ({
-                    entities: device.entities,
-                    name: device.name,
-                    id: device.id,
-                    integration: this.getDeviceIntegrationLabel(device),
-                    integrations: device.integrations || [],
-                    area: this.getDeviceAreaLabel(device),
-                    disabled_by: device.disabled_by || null,
-                    labels: device.labels || [],
-                    read: false,
-                    write: false
-                }));
-            this.filterEntitiesWithoutDevices();
-
-            if (this.selected && !this.isAnUser && this.selected.id) {
-                this.loadData(this.selected);
-            }
-        });
+
+        this.entitiesWithoutDevices = entitiesWithoutDevices;
+        this.tableData = rows;
     }
 
     getDeviceIntegrationLabel(device) {
@@ -610,31 +910,12 @@ class AccessControlManager extends LitElement {
         return (device.entities || []).find(entity => entity.area)?.area || '';
     }
 
-    fetchDashboards() {
-        this.hass.callWS({ type: 'ha_access_control/list_dashboards' }).then(dashboards => {
-            this.initializeDashboardsData(Array.isArray(dashboards) ? dashboards : []);
-        });
-    }
-
-    fetchHelpers() {
-        this.hass.callWS({ type: 'ha_access_control/list_helpers' }).then(helpers => {
-            this.helperTableData = helpers.map(helper => ({
-                ...helper,
-                read: false,
-                write: false
-            }));
-            this.filterEntitiesWithoutDevices();
-
-            if (this.selected && !this.isAnUser && this.selected.id) {
-                this.loadData(this.selected);
-            }
-        });
-    }
-
-    fetchLabels() {
-        this.hass.callWS({ type: 'ha_access_control/list_labels' }).then(labels => {
-            this.labelTableData = Array.isArray(labels) ? labels : [];
-        });
+    setHelpers(helpers) {
+        this.helperTableData = helpers.map(helper => ({
+            ...helper,
+            read: false,
+            write: false
+        }));
     }
 
     filterEntitiesWithoutDevices() {
@@ -649,12 +930,43 @@ class AccessControlManager extends LitElement {
     }
 
     fetchAuths() {
-        this.hass.callWS({ type: 'ha_access_control/list_auths' }).then(data => {
+        fetchWithRevision(this.hass, 'ha_access_control/list_auths').then(data => {
             this.loadAuths(data);
         });
     }
 
+    applyAuthDelta(delta) {
+        if (delta && delta.revision === this.authRevision) {
+            // No-op mutation: the server kept the revision and the snapshot is still current.
+            return;
+        }
+
+        if (!delta || delta.revision !== this.authRevision + 1) {
+            // A mutation happened elsewhere since our last snapshot: resync everything.
+            this.fetchAuths();
+            return;
+        }
+
+        const removedGroupIds = new Set(delta.removed_group_ids || []);
+        const groups = new Map(
+            this.dataGroups
+                .filter(group => !removedGroupIds.has(group.id))
+                .map(group => [group.id, group])
+        );
+        (delta.groups || []).forEach(group => groups.set(group.id, group));
+
+        const users = new Map(this.dataUsers.map(user => [user.id, user]));
+        (delta.users || []).forEach(user => users.set(user.id, user));
+
+        this.loadAuths({
+            groups: [...groups.values()],
+            users: [...users.values()],
+            revision: delta.revision
+        });
+    }
+
     loadAuths(data) {
+        this.authRevision = data.revision ?? 0;
         const groups = Array.isArray(data.groups) ? data.groups.map(group => ({
             ...group,
             dashboards: group.dashboards || {}
@@ -833,82 +1145,45 @@ class AccessControlManager extends LitElement {
         this.requestUpdate();
     }
 
-    loadData(data) {
-        let allTrueRW = false;
-        let allTrueRead = false;
-        if (data.id === 'system-users' || data.id === 'system-admin') {
-            allTrueRW = true;
+    getPolicyAccess(data, entityId) {
+        if (data?.id === 'system-users' || data?.id === 'system-admin') {
+            return { read: true, write: true };
         }
 
-        if (data.id === 'system-read-only') {
-            allTrueRead = true;
+        if (data?.id === 'system-read-only') {
+            return { read: true, write: false };
         }
 
-        this.tableData.forEach(device => {
-            device.entities.forEach(entity => {
-                if (allTrueRW) {
-                    entity.read = true;
-                    entity.write = true;
-                    return;
-                }
+        const entityPolicy = data?.policy?.entities?.entity_ids?.[entityId];
+        if (entityPolicy) {
+            return { read: true, write: typeof entityPolicy !== 'object' };
+        }
 
-                if (allTrueRead) {
-                    entity.read = true;
-                    entity.write = false;
-                    return;
-                }
+        return { read: false, write: false };
+    }
 
-                if(data.policy?.entities?.entity_ids[entity.entity_id]) {
-                    entity.read = data.policy.entities.entity_ids[entity.entity_id] ? true : false;
-                    entity.write = data.policy.entities.entity_ids[entity.entity_id] && typeof data.policy.entities.entity_ids[entity.entity_id] !== 'object' ? true : false;
-                } else {
-                    entity.read = false;
-                    entity.write = false;
-                }
+    loadData(data) {
+        this.tableData.forEach(device => {
+            device.entities.forEach(entity => {
+                const access = this.getPolicyAccess(data, entity.entity_id);
+                entity.read = access.read;
+                entity.write = access.write;
             });
 
             device.read = this.getAggregateState(device.entities, 'read');
             device.write = this.getAggregateState(device.entities, 'write');
 
         });
-        this.helperTableData = this.helperTableData.map(helper => {
-            if (allTrueRW) {
-                return { ...helper, read: true, write: true };
-            }
-
-            if (allTrueRead) {
-                return { ...helper, read: true, write: false };
-            }
-
-            if (data.policy?.entities?.entity_ids[helper.entity_id]) {
-                const helperPolicy = data.policy.entities.entity_ids[helper.entity_id];
-                const read = helperPolicy ? true : false;
-                const write = helperPolicy && typeof helperPolicy !== 'object' ? true : false;
-                return { ...helper, read, write };
-            }
-
-            return { ...helper, read: false, write: false };
-        });
+        this.helperTableData = this.helperTableData.map(helper => ({
+            ...helper,
+            ...this.getPolicyAccess(data, helper.entity_id)
+        }));
 
         this.filterEntitiesWithoutDevices();
-        this.entitiesWithoutDevices = this.entitiesWithoutDevices.map(entity => {
-            if (allTrueRW) {
-                return { ...entity, read: true, write: true };
-            }
-
-            if (allTrueRead) {
-                return { ...entity, read: true, write: false };
-            }
-
-            if (data.policy?.entities?.entity_ids[entity.entity_id]) {
-                const entityPolicy = data.policy.entities.entity_ids[entity.entity_id];
-                const read = entityPolicy ? true : false;
-                const write = entityPolicy && typeof entityPolicy !== 'object' ? true : false;
-                return { ...entity, read, write };
-            }
-
-            return { ...entity, read: false, write: false };
-        });
+        this.entitiesWithoutDevices = this.entitiesWithoutDevices.map(entity => ({
+            ...entity,
+            ...this.getPolicyAccess(data, entity.entity_id)
+        }));
 
         this.tableData = [...this.tableData];
         this.requestUpdate();
@@ -1001,7 +1276,7 @@ class AccessControlManager extends LitElement {
         this.hass.callWS({ type: 'ha_access_control/create_group', name })
             .then(result => {
                 this.closeCreateGroupDialog();
-                this.loadAuths(result.data);
+                this.applyAuthDelta(result.delta);
             })
             .catch(error => {
                 console.error('Unable to create group:', error);
@@ -1206,7 +1481,7 @@ class AccessControlManager extends LitElement {
                 }
 
                 this.closeRenameGroupDialog();
-                this.loadAuths(result.data);
+                this.applyAuthDelta(result.delta);
             })
             .catch(error => {
                 console.error('Unable to rename group:', error);
@@ -1248,7 +1523,7 @@ class AccessControlManager extends LitElement {
         this.hass.callWS({ type: 'ha_access_control/delete_group', group_id: groupToDelete.id })
             .then(result => {
                 this.closeDeleteGroupDialog();
-                this.loadAuths(result.data);
+                this.applyAuthDelta(result.delta);
             })
             .catch(error => {
                 console.error('Unable to delete group:', error);
@@ -1388,7 +1663,7 @@ class AccessControlManager extends LitElement {
             source_group_id: sourceGroupId
         })
             .then(result => {
-                this.loadAuths(result.data);
+                this.applyAuthDelta(result.delta);
             })
             .catch(error => {
                 console.error('Unable to duplicate group:', error);
@@ -2254,8 +2529,8 @@ class AccessControlManager extends LitElement {
         this._isSaving = true;
         this.requestUpdate();
         this.hass.callWS({ type: 'ha_access_control/set_auths', isAnUser: this.isAnUser, data: payload })
-            .then(data => {
-                this.loadAuths(data);
+            .then(result => {
+                this.applyAuthDelta(result.delta);
             })
             .finally(() => {
                 this._isSaving = false;